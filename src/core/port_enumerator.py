@@ -1,5 +1,7 @@
 
 import logging
+import threading
+import time
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -42,35 +44,59 @@ class PortEnumerator:
     Focuses on reliability over features - critical for marine operations.
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None, cache_ttl: float = 3.0):
         self.logger = logger or logging.getLogger(__name__)
         self.registry_available = WINREG_AVAILABLE
+
+        # Short-lived scan cache - back-to-back callers reuse one registry scan
+        self.cache_ttl = cache_ttl
+        self._cache_lock = threading.Lock()
+        self._cached_ports: Optional[List[SerialPortInfo]] = None
+        self._cache_time = 0.0
         
         if not self.registry_available:
             self.logger.warning("Windows registry access not available - port detection will be limited")
     
-    def enumerate_ports(self) -> List[SerialPortInfo]:
+    def enumerate_ports(self, max_age: Optional[float] = None) -> List[SerialPortInfo]:
         """
         Enumerate all available serial ports.
         
+        Args:
+            max_age: Reuse a previous scan no older than this many seconds
+                     (defaults to cache_ttl; 0 forces a fresh scan)
+        
         Returns:
             List of SerialPortInfo objects, sorted by port number
         """
+        ttl = self.cache_ttl if max_age is None else max_age
+        with self._cache_lock:
+            if self._cached_ports is not None and time.monotonic() - self._cache_time < ttl:
+                return list(self._cached_ports)
+        
         ports = []
         
         if not self.registry_available:
             self.logger.error("Cannot enumerate ports - Windows registry not available")
-            return self._get_fallback_ports()
-        
-        try:
-            ports = self._scan_registry_ports()
-            self.logger.info(f"Found {len(ports)} serial ports")
-            
-        except Exception as e:
-            self.logger.error(f"Port enumeration failed: {e}")
             ports = self._get_fallback_ports()
+        else:
+            try:
+                ports = self._scan_registry_ports()
+                self.logger.info(f"Found {len(ports)} serial ports")
+                
+            except Exception as e:
+                self.logger.error(f"Port enumeration failed: {e}")
+                ports = self._get_fallback_ports()
         
-        return ports
+        with self._cache_lock:
+            self._cached_ports = ports
+            self._cache_time = time.monotonic()
+        
+        return list(ports)
+    
+    def invalidate_cache(self):
+        """Discard the cached scan so the next enumeration reads the registry."""
+        with self._cache_lock:
+            self._cached_ports = None
     
     def _scan_registry_ports(self) -> List[SerialPortInfo]:
         """Scan Windows registry for serial ports"""
@@ -106,7 +132,7 @@ class PortEnumerator:
             raise
         
         # Sort ports by port number for consistent ordering
-        ports.sort(key=lambda p: self._port_sort_key(p.port_name))
+        ports.sort(key=self._port_sort_key)
         return ports
     
     def _classify_port(self, device_name: str, port_name: str) -> SerialPortInfo:
@@ -156,8 +182,10 @@ class PortEnumerator:
             description="Physical serial port"
         )
     
-    def _port_sort_key(self, port_name: str) -> Tuple[int, int]:
-        """Generate sort key for port names (COM1, COM2, etc.)"""
+    @staticmethod
+    def _port_sort_key(port: SerialPortInfo) -> Tuple[int, int]:
+        """Generate sort key for ports by name (COM1, COM2, etc.)"""
+        port_name = port.port_name
         try:
             if port_name.startswith("COM"):
                 num = int(port_name[3:])
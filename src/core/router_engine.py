@@ -1080,7 +1080,8 @@ class SerialRouterCore:
             self.peak_throughput = total_current_throughput
         
         # Combine PortManager stats with router stats for comprehensive view
-        combined_bytes_transferred = self.bytes_transferred.copy()
+        direction_bytes = self.bytes_transferred.copy()
+        combined_bytes_transferred = dict(direction_bytes)
         
         # Add PortManager port statistics to the status
         for port_name, port_info in port_status.items():
@@ -1129,6 +1130,10 @@ class SerialRouterCore:
         
         avg_queue_utilization = total_queue_utilization / queue_count if queue_count > 0 else 0
         
+        # Snapshot counters once and pre-sum them so GUI consumers read flat scalars
+        error_counts = self.error_counts.copy()
+        thread_restart_counts = self.thread_restart_counts.copy()
+        
         return {
             # Core system status
             "running": self.running,
@@ -1136,13 +1141,17 @@ class SerialRouterCore:
             "outgoing_ports": self.outgoing_ports,
             "active_threads": active_threads,
             "bytes_transferred": combined_bytes_transferred,
+            "direction_bytes": direction_bytes,
+            "total_bytes_transferred": sum(direction_bytes.values()),
             "session_totals": self.session_totals.copy(),
             "transfer_rates": {
                 direction: self._calculate_transfer_rate(direction)
                 for direction in self.rate_samples.keys()
             },
-            "error_counts": self.error_counts.copy(),
-            "thread_restart_counts": self.thread_restart_counts.copy(),
+            "error_counts": error_counts,
+            "total_errors": sum(error_counts.values()),
+            "thread_restart_counts": thread_restart_counts,
+            "total_thread_restarts": sum(thread_restart_counts.values()),
 
             # Critical monitoring dashboard metrics
             "critical_metrics": {
@@ -1259,12 +1268,12 @@ def main():
             time.sleep(30)  # Status update every 30 seconds
             status = router.get_status()
             
-            if status["bytes_transferred"]:
-                total_bytes = sum(status["bytes_transferred"].values())
+            if status["direction_bytes"]:
+                total_bytes = status["total_bytes_transferred"]
                 print(f"Status: {status['active_threads']}/3 threads active, {total_bytes:,} bytes transferred")
             
             if status["error_counts"]:
-                total_errors = sum(status["error_counts"].values())
+                total_errors = status["total_errors"]
                 if total_errors > 0:
                     print(f"Errors: {total_errors} total")
     
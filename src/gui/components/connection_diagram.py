@@ -430,6 +430,9 @@ class ConnectionDiagramWidget(QGraphicsView):
     
     def set_connection_states(self, states: dict):
         """Update connection states with smooth animations."""
+        # Steady state on every status tick - nothing to restyle
+        if all(self.connection_states.get(port) == state for port, state in states.items()):
+            return
         self.connection_states.update(states)
         self.update_connection_states()
     
@@ -3,8 +3,12 @@ Data Flow Monitor Widget for SerialRouter
 Displays real-time statistics, health metrics, and data flow monitoring.
 """
 
+import sys
+import time
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QGroupBox, QGridLayout, QVBoxLayout,
     QHBoxLayout, QFormLayout, QProgressBar, QApplication, QFrame
@@ -14,6 +18,31 @@ from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QPen, QBrush
 from src.gui.resources import resource_manager
 
 
+# Status dict keys read every tick
+K_BYTES = "bytes_transferred"
+K_RATES = "transfer_rates"
+K_CRITICAL = "critical_metrics"
+K_HEALTH = "system_health"
+K_THREADS = "active_threads"
+K_CONNECTIONS = "port_connections"
+K_TOTAL_ERRORS = "total_errors"
+
+# Shared fallback for status sections that are missing - avoids a fresh {} per lookup
+_EMPTY = MappingProxyType({})
+
+
+@lru_cache(maxsize=256)
+def _format_uptime_minutes(total_minutes: int) -> str:
+    """Format whole minutes of uptime (e.g., "34m", "2h 34m", "1.2 days")."""
+    if total_minutes < 60:
+        return f"{total_minutes}m"
+    elif total_minutes < 24 * 60:
+        hours, minutes = divmod(total_minutes, 60)
+        return f"{hours}h {minutes}m"
+    else:
+        return "%.1f days" % (total_minutes / (24 * 60))
+
+
 class MetricMeter:
     """
     Dynamic scaling calculator for activity meters.
@@ -64,6 +93,8 @@ class HorizontalActivityMeter(QWidget):
 
         # Configuration
         self._num_segments = num_segments
+        # Progressive opacity per segment (segments towards right = more opaque) - fixed, so built once
+        self._segment_opacity = tuple(0.70 + ((i + 1) / num_segments) * 0.30 for i in range(num_segments))
         self._current_value = 0.0  # 0-100 percentage
         self._target_value = 0.0   # For smooth animation
 
@@ -102,7 +133,10 @@ class HorizontalActivityMeter(QWidget):
         Args:
             value: Percentage 0-100 for meter display
         """
-        self._target_value = max(0, min(100, value))
+        value = max(0, min(100, value))
+        if value == self._target_value and not self._animation_timer.isActive():
+            return  # Already showing this value - skip the animation tick and repaint
+        self._target_value = value
 
         # Start animation if not already running
         if not self._animation_timer.isActive():
@@ -144,9 +178,7 @@ class HorizontalActivityMeter(QWidget):
             x = i * (segment_width + segment_gap) + segment_gap
             y = 2
 
-            # Progressive opacity (segments towards right = more opaque)
-            base_intensity = (i + 1) / self._num_segments
-            segment_opacity = 0.70 + (base_intensity * 0.30)
+            segment_opacity = self._segment_opacity[i]
 
             # Determine fill state
             if i < filled_segments:
@@ -224,6 +256,12 @@ class TransferTableRow(QWidget):
         self.volume_label.setMinimumWidth(80)
         self.volume_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
 
+        # Last displayed values - unchanged numbers skip formatting, unchanged strings skip setText
+        self._last_rate = 0
+        self._last_bytes = 0
+        self._rate_text = "0 B/s"
+        self._volume_text = "0 bytes"
+
         self._init_ui()
 
     def _init_ui(self):
@@ -261,23 +299,37 @@ class TransferTableRow(QWidget):
             total_bytes: Cumulative bytes transferred
             rate_percentage: Percentage 0-100 for rate meter
         """
-        self.rate_label.setText(self._format_rate(rate))
-        self.volume_label.setText(self._format_bytes(total_bytes))
+        if rate != self._last_rate:
+            self._last_rate = rate
+            rate_text = self._format_rate(rate)
+            if rate_text != self._rate_text:
+                self._rate_text = rate_text
+                self.rate_label.setText(rate_text)
+
+        if total_bytes != self._last_bytes:
+            self._last_bytes = total_bytes
+            volume_text = self._format_bytes(total_bytes)
+            if volume_text != self._volume_text:
+                self._volume_text = volume_text
+                self.volume_label.setText(volume_text)
+
         self.rate_meter.setValue(rate_percentage)
 
+    # Float-precision formats use %-formatting - measurably cheaper than the equivalent f-string;
+    # plain integer interpolation stays as f-strings, which are faster there
     def _format_rate(self, rate: float) -> str:
         """Format transfer rate."""
         if rate > 1024:
-            return f"{rate/1024:.1f} KB/s"
+            return "%.1f KB/s" % (rate / 1024)
         else:
-            return f"{rate:.0f} B/s"
+            return "%.0f B/s" % rate
 
     def _format_bytes(self, count: int) -> str:
         """Format byte count."""
         if count > 1_000_000:
-            return f"{count/1_000_000:.1f} MB"
+            return "%.1f MB" % (count / 1_000_000)
         elif count > 1024:
-            return f"{count/1024:.1f} KB"
+            return "%.1f KB" % (count / 1024)
         else:
             return f"{count} bytes"
 
@@ -293,6 +345,20 @@ class AnimatedHealthIndicator(QWidget):
     Uses simple QTimer + manual painting (proven reliable approach).
     """
 
+    # Map actual router status values to colors
+    STATUS_COLORS = {
+        "Good": QColor("#28A745"),       # Green - pulse (active, healthy)
+        "Ok": QColor("#28A745"),         # Green - pulse (idle, healthy)
+        "Warning": QColor("#FFC107"),    # Yellow - pulse (degraded)
+        "Critical": QColor("#DC3545"),   # Red - pulse (critical)
+        "OFFLINE": QColor("#6C757D"),    # Gray - static (stopped)
+        "UNKNOWN": QColor("#6C757D")     # Gray - static (unknown)
+    }
+    DEFAULT_COLOR = QColor("#6C757D")
+
+    # Only OFFLINE/UNKNOWN are static
+    ANIMATED_STATUSES = frozenset({"Good", "Ok", "Warning", "Critical"})
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -300,7 +366,8 @@ class AnimatedHealthIndicator(QWidget):
         self.setFixedSize(20, 20)
 
         # Current state
-        self._color = QColor("#6C757D")  # Default grey
+        self._color = QColor(self.DEFAULT_COLOR)  # Default grey
+        self._status = None  # Last applied status - repeated updates are ignored
         self._opacity = 1.0
         self._opacity_direction = -1  # -1 = fading out, 1 = fading in
 
@@ -311,20 +378,15 @@ class AnimatedHealthIndicator(QWidget):
 
     def set_status(self, status: str):
         """Update color and animation based on health status."""
-        # Map actual router status values to colors
-        color_map = {
-            "Good": QColor("#28A745"),       # Green - pulse (active, healthy)
-            "Ok": QColor("#28A745"),         # Green - pulse (idle, healthy)
-            "Warning": QColor("#FFC107"),    # Yellow - pulse (degraded)
-            "Critical": QColor("#DC3545"),   # Red - pulse (critical)
-            "OFFLINE": QColor("#6C757D"),    # Gray - static (stopped)
-            "UNKNOWN": QColor("#6C757D")     # Gray - static (unknown)
-        }
-
-        self._color = color_map.get(status, QColor("#6C757D"))
+        # Status arrives every tick - only act on transitions
+        if status == self._status:
+            return
+        self._status = status
+
+        self._color = self.STATUS_COLORS.get(status, self.DEFAULT_COLOR)
 
         # Enable animation for all active states (only OFFLINE/UNKNOWN are static)
-        should_animate = status in ["Good", "Ok", "Warning", "Critical"]
+        should_animate = status in self.ANIMATED_STATUSES
 
         if should_animate:
             # Start pulsing animation
@@ -441,6 +503,7 @@ class HealthTableRow(QWidget):
         self.value_label.setFont(self._mono_font)
         self.value_label.setMinimumWidth(120)
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        self._value_text = "—"  # Last displayed value - unchanged values skip setText
 
         # Column 3: Visual indicator (optional)
         self.indicator_container = QWidget()
@@ -476,7 +539,9 @@ class HealthTableRow(QWidget):
 
     def update_value(self, value: str):
         """Update the value display."""
-        self.value_label.setText(value)
+        if value != self._value_text:
+            self._value_text = value
+            self.value_label.setText(value)
 
     def update_indicator(self, status: str):
         """
@@ -509,13 +574,26 @@ class DataFlowMonitorWidget(QWidget):
         self.last_bytes_transferred = {}
         self.last_update_time = datetime.now()
         self._last_status_error = None
-        self._last_status_error_time = None
+        self._last_status_error_time = 0.0
 
         # Current port configuration - will be set by main window
         self._current_incoming_port = ""
         self._current_port1 = "COM131"
         self._current_port2 = "COM141"
 
+        # Direction keys for the current port configuration, rebuilt only when ports change
+        self._dir_cache_key = None
+        self._dir_keys = None
+
+        # (active_threads, connected_ports, total_ports) last shown in the connections row
+        self._connections_state = None
+
+        # Raw metric inputs last rendered per health row - unchanged inputs skip formatting
+        self._rendered_inputs: Dict[str, Any] = {}
+
+        # Every rendered status input from the last full update - identical idle ticks are skipped
+        self._last_snapshot = None
+
         # Table row references - Data Transfer
         self.incoming_row = None
         self.port1_row = None
@@ -738,20 +816,21 @@ class DataFlowMonitorWidget(QWidget):
         outer_layout.addWidget(health_content)
         return group
 
-    def update_display(self, status: Dict[str, Any],
-                       incoming_port: str,
-                       outgoing_port1: str,
-                       outgoing_port2: str):
+    def set_port_configuration(self, incoming_port: str, outgoing_port1: str, outgoing_port2: str):
         """
-        Update all stats displays with current router status.
+        Set the routed ports shown in the transfer table.
+        Rebuilds port labels and direction keys; called on configuration change, not per tick.
 
         Args:
-            status: Router status dictionary from router_core.get_status()
             incoming_port: Currently selected incoming port (e.g., "COM1", "COM3")
             outgoing_port1: First outgoing port (e.g., "COM131")
             outgoing_port2: Second outgoing port (e.g., "COM141")
         """
-        # Store current port configuration
+        key = (incoming_port, outgoing_port1, outgoing_port2)
+        if key == self._dir_cache_key:
+            return
+
+        self._dir_cache_key = key
         self._current_incoming_port = incoming_port
         self._current_port1 = outgoing_port1
         self._current_port2 = outgoing_port2
@@ -761,15 +840,66 @@ class DataFlowMonitorWidget(QWidget):
         self.port1_row.set_port_name(outgoing_port1)
         self.port2_row.set_port_name(outgoing_port2)
 
-        try:
-            bytes_data = status.get("bytes_transferred", {})
-            session_totals = status.get("session_totals", {})
-            transfer_rates = status.get("transfer_rates", {})
+        self._dir_keys = (
+            sys.intern(f"{incoming_port}->{self._port_number(outgoing_port1)}&{self._port_number(outgoing_port2)}"),
+            sys.intern(f"{outgoing_port1}->Incoming"),
+            sys.intern(f"{outgoing_port2}->Incoming")
+        )
 
+    def update_display(self, status: Dict[str, Any]):
+        """
+        Update all stats displays with current router status.
+
+        Port directions come from the last set_port_configuration() call.
+
+        Args:
+            status: Router status dictionary from router_core.get_status()
+        """
+        if self._dir_keys is None:
+            self.set_port_configuration(self._current_incoming_port, self._current_port1, self._current_port2)
+
+        out_direction, in1_direction, in2_direction = self._dir_keys
+
+        # Destructure the status once - missing sections share one read-only empty mapping
+        bytes_data = status.get(K_BYTES) or _EMPTY
+        transfer_rates = status.get(K_RATES) or _EMPTY
+        critical_metrics = status.get(K_CRITICAL) or _EMPTY
+        system_health = status.get(K_HEALTH) or _EMPTY
+        port_connections = status.get(K_CONNECTIONS) or _EMPTY
+
+        out_rate = transfer_rates.get(out_direction, 0)
+        in1_rate = transfer_rates.get(in1_direction, 0)
+        in2_rate = transfer_rates.get(in2_direction, 0)
+        queue_util = critical_metrics.get("avg_queue_utilization_percent", 0)
+
+        # Idle tick with the same inputs as last time - every row would render identical
+        # values, so only advance the meter scale decay and skip the widget pass entirely
+        snapshot = (
+            self._dir_keys,
+            (out_rate, in1_rate, in2_rate),
+            (bytes_data.get(out_direction, 0), bytes_data.get(in1_direction, 0), bytes_data.get(in2_direction, 0)),
+            system_health.get("overall_health_status"),
+            system_health.get("total_port_errors"),
+            critical_metrics.get("system_uptime_hours"),
+            queue_util,
+            status.get(K_THREADS),
+            status.get(K_TOTAL_ERRORS),
+            tuple(info.get("connected", False) for info in port_connections.values()),
+        )
+        idle = not (out_rate or in1_rate or in2_rate or queue_util or self._error_history)
+        if idle and snapshot == self._last_snapshot:
+            self.meter_tracker_incoming.update(0)
+            self.meter_tracker_port1.update(0)
+            self.meter_tracker_port2.update(0)
+            self.meter_tracker_queue.update(0)
+            return
+        self._last_snapshot = snapshot
+
+        # Rows only call setText/setValue when their diff cache sees a change; Qt already
+        # coalesces those into a single paint per event-loop pass
+        try:
             # INCOMING BROADCAST DATA
             # This is the data going from incoming port to both outgoing clients
-            out_direction = f"{incoming_port}->{outgoing_port1.replace('COM', '')}&{outgoing_port2.replace('COM', '')}"
-            out_rate = transfer_rates.get(out_direction, 0)
             out_bytes = bytes_data.get(out_direction, 0)
 
             # Calculate dynamic meter percentage
@@ -784,8 +914,6 @@ class DataFlowMonitorWidget(QWidget):
 
             # PORT 1 RESPONSE DATA
             # Data coming back from outgoing_port1 to incoming
-            in1_direction = f"{outgoing_port1}->Incoming"
-            in1_rate = transfer_rates.get(in1_direction, 0)
             in1_bytes = bytes_data.get(in1_direction, 0)
             rate_percentage1 = self.meter_tracker_port1.update(in1_rate)
 
@@ -797,8 +925,6 @@ class DataFlowMonitorWidget(QWidget):
 
             # PORT 2 RESPONSE DATA
             # Data coming back from outgoing_port2 to incoming
-            in2_direction = f"{outgoing_port2}->Incoming"
-            in2_rate = transfer_rates.get(in2_direction, 0)
             in2_bytes = bytes_data.get(in2_direction, 0)
             rate_percentage2 = self.meter_tracker_port2.update(in2_rate)
 
@@ -809,70 +935,88 @@ class DataFlowMonitorWidget(QWidget):
             )
 
             # UPDATE SYSTEM STATUS
-            self._update_system_status(status)
+            self._update_system_status(status, critical_metrics, system_health, port_connections)
 
         except Exception as e:
             # Error tracking
-            import time
             error_type = type(e).__name__
-            if not self._last_status_error or self._last_status_error != error_type:
+            current_time = time.monotonic()
+            # Record each new error type, at most once per second
+            if (self._last_status_error != error_type
+                    and current_time - self._last_status_error_time >= 1.0):
                 self._last_status_error = error_type
-                self._last_status_error_time = time.time()
+                self._last_status_error_time = current_time
 
-    def _update_system_status(self, status: Dict[str, Any]):
+    @staticmethod
+    def _port_number(port_name: str) -> str:
+        """Strip the COM prefix from a port name (e.g., "COM131" -> "131")."""
+        if port_name.startswith("COM"):
+            return port_name[3:]
+        return port_name.replace("COM", "")
+
+    def _update_system_status(self, status: Dict[str, Any], critical_metrics: Mapping[str, Any],
+                              system_health: Mapping[str, Any], port_connections: Mapping[str, Any]):
         """Update system status section with new table row structure."""
-        critical_metrics = status.get("critical_metrics", {})
-        system_health = status.get("system_health", {})
 
         # 1. HEALTH STATUS - with color indicator
         health_status = system_health.get("overall_health_status", "UNKNOWN")
-        self.health_row.update_value(HealthTableRow.format_status(health_status))
-        self.health_row.update_indicator(health_status)
+        if self._input_changed("health", health_status):
+            self.health_row.update_value(HealthTableRow.format_status(health_status))
+            self.health_row.update_indicator(health_status)
 
         # 2. UPTIME - formatted time display
         uptime_hours = critical_metrics.get("system_uptime_hours", 0)
-        uptime_text = self._format_uptime(uptime_hours)
-        self.uptime_row.update_value(uptime_text)
+        if self._input_changed("uptime", uptime_hours):
+            self.uptime_row.update_value(self._format_uptime(uptime_hours))
 
         # 3. ACTIVE CONNECTIONS - combined ports/threads metric
-        active_threads = status.get("active_threads", 0)
-        port_connections = status.get("port_connections", {})
+        active_threads = status.get(K_THREADS, 0)
         connected_ports = 0
         total_ports = 0
 
-        if port_connections:
-            connected_ports = sum(1 for p in port_connections.values() if p.get("connected", False))
-            total_ports = len(port_connections)
-
-        # Format: "3/3 Active (3 ports)"
-        connections_text = f"{active_threads}/3 Active"
-        if total_ports > 0:
-            connections_text += f" ({connected_ports}/{total_ports} ports)"
-
-        self.connections_row.update_value(connections_text)
+        # Count total and connected ports in a single pass
+        for port_info in port_connections.values():
+            total_ports += 1
+            if port_info.get("connected", False):
+                connected_ports += 1
+
+        # Format: "3/3 Active (3 ports)" - rebuilt only when one of its components changes
+        connections_state = (active_threads, connected_ports, total_ports)
+        if connections_state != self._connections_state:
+            self._connections_state = connections_state
+            connections_text = f"{active_threads}/3 Active"
+            if total_ports > 0:
+                connections_text += f" ({connected_ports}/{total_ports} ports)"
+            self.connections_row.update_value(connections_text)
 
         # 4. QUEUE UTILIZATION - percentage with meter
         queue_util = critical_metrics.get("avg_queue_utilization_percent", 0)
-        self.queue_row.update_value(f"{queue_util:.1f}%")
+        if self._input_changed("queue", queue_util):
+            self.queue_row.update_value("%.1f%%" % queue_util)
 
         # Calculate meter percentage (0-100 scale)
         queue_percentage = self.meter_tracker_queue.update(queue_util)
         self.queue_row.update_meter(queue_percentage)
 
         # 5. TOTAL ERRORS - combined error count
-        error_data = status.get("error_counts", {})
-        router_errors = 0
-        for key, value in error_data.items():
-            if isinstance(value, int):
-                router_errors += value
+        router_errors = status.get(K_TOTAL_ERRORS, 0)  # Pre-summed by the core
 
         port_errors = system_health.get("total_port_errors", 0)
         total_errors = router_errors + port_errors
-        self.errors_row.update_value(str(total_errors))
+        if self._input_changed("errors", total_errors):
+            self.errors_row.update_value(str(total_errors))
 
         # 6. ERROR RATE - errors per minute
         error_rate = self._calculate_error_rate(total_errors)
-        self.error_rate_row.update_value(f"{error_rate:.1f}/min")
+        if self._input_changed("error_rate", error_rate):
+            self.error_rate_row.update_value("%.1f/min" % error_rate)
+
+    def _input_changed(self, key: str, value: Any) -> bool:
+        """Record a metric's raw input; True if it differs from the last rendered value."""
+        if key in self._rendered_inputs and self._rendered_inputs[key] == value:
+            return False
+        self._rendered_inputs[key] = value
+        return True
 
     def _format_uptime(self, uptime_hours: float) -> str:
         """
@@ -884,16 +1028,8 @@ class DataFlowMonitorWidget(QWidget):
         Returns:
             Formatted string (e.g., "34m", "2h 34m", "1.2 days")
         """
-        if uptime_hours < 1:
-            uptime_minutes = int(uptime_hours * 60)
-            return f"{uptime_minutes}m"
-        elif uptime_hours < 24:
-            hours = int(uptime_hours)
-            minutes = int((uptime_hours - hours) * 60)
-            return f"{hours}h {minutes}m"
-        else:
-            uptime_days = uptime_hours / 24
-            return f"{uptime_days:.1f} days"
+        # Quantize to whole minutes so repeated readings hit the formatter cache
+        return _format_uptime_minutes(int(uptime_hours * 60))
 
     def _calculate_error_rate(self, current_error_count: int) -> float:
         """
@@ -905,7 +1041,6 @@ class DataFlowMonitorWidget(QWidget):
         Returns:
             Errors per minute (float)
         """
-        import time
         current_time = time.time()
 
         # If error count increased, record the change
@@ -937,7 +1072,9 @@ class DataFlowMonitorWidget(QWidget):
         if self.port2_row:
             self.port2_row.update_data(0, 0, 0)
 
-        # Reset system status table rows
+        # Reset system status table rows - next tick re-renders every metric
+        self._rendered_inputs.clear()
+        self._last_snapshot = None
         if self.health_row:
             self.health_row.update_value(HealthTableRow.format_status("OFFLINE"))
             self.health_row.update_indicator("OFFLINE")
@@ -945,6 +1082,7 @@ class DataFlowMonitorWidget(QWidget):
             self.uptime_row.update_value("0m")
         if self.connections_row:
             self.connections_row.update_value("0/3 Active")
+            self._connections_state = (0, 0, 0)
         if self.queue_row:
             self.queue_row.update_value("0.0%")
             self.queue_row.update_meter(0)
@@ -21,6 +21,19 @@ class EnhancedStatusWidget(QWidget):
     STATE_ACTIVE = "active"
     STATE_STOPPING = "stopping"
     STATE_ERROR = "error"
+
+    # State to icon filename lookup
+    STATE_ICONS = {
+        STATE_OFFLINE: "status_offline.svg",
+        STATE_STARTING: "status_starting.svg",
+        STATE_ACTIVE: "status_active.svg",
+        STATE_STOPPING: "status_stopping.svg",
+        STATE_ERROR: "status_error.svg"
+    }
+
+    # States that pulse, and states whose text is emphasised
+    PULSING_STATES = frozenset({STATE_STARTING, STATE_STOPPING})
+    EMPHASISED_STATES = frozenset({STATE_ERROR, STATE_ACTIVE})
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -129,7 +142,7 @@ class EnhancedStatusWidget(QWidget):
         self._current_state = state
 
         # Handle animations based on state
-        if state in [self.STATE_STARTING, self.STATE_STOPPING]:
+        if state in self.PULSING_STATES:
             self.start_pulse_animation()
         else:
             self.stop_pulse_animation()
@@ -154,7 +167,7 @@ class EnhancedStatusWidget(QWidget):
         base_color = self.colors[self._current_state]
         
         # Apply pulse effect for transitional states using Qt's color methods
-        if self._current_state in [self.STATE_STARTING, self.STATE_STOPPING]:
+        if self._current_state in self.PULSING_STATES:
             # Use Qt's lighter/darker methods instead of alpha for better theme compatibility
             pulse_factor = int(100 + (self._pulse_opacity * 100))  # 100-200 range
             return base_color.lighter(pulse_factor)
@@ -163,17 +176,8 @@ class EnhancedStatusWidget(QWidget):
         
     def update_display(self):
         """Update the icon and text display based on current state."""
-        # Map states to icon filenames
-        icon_map = {
-            self.STATE_OFFLINE: "status_offline.svg",
-            self.STATE_STARTING: "status_starting.svg",
-            self.STATE_ACTIVE: "status_active.svg",
-            self.STATE_STOPPING: "status_stopping.svg",
-            self.STATE_ERROR: "status_error.svg"
-        }
-
         # Load and display the SVG icon
-        icon_filename = icon_map.get(self._current_state, "status_offline.svg")
+        icon_filename = self.STATE_ICONS.get(self._current_state, "status_offline.svg")
         icon = resource_manager.load_icon(icon_filename, "toolbar")
 
         if not icon.isNull():
@@ -181,7 +185,7 @@ class EnhancedStatusWidget(QWidget):
 
         # Update text with optional emphasis for important states
         status_text = self.state_texts[self._current_state]
-        if self._current_state in [self.STATE_ERROR, self.STATE_ACTIVE]:
+        if self._current_state in self.EMPHASISED_STATES:
             # Subtle emphasis for important states
             self.text_label.setText(f"<span style='font-weight: 500;'>{status_text}</span>")
         else:
@@ -1,134 +1,297 @@
-
+import os
 import sys
 import json
 import logging
 import subprocess
 import time
 import threading
+import queue
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Optional, TYPE_CHECKING
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QComboBox, QPushButton, QTextEdit, QFrame, QGroupBox,
+    QLabel, QComboBox, QPushButton, QPlainTextEdit, QFrame, QGroupBox,
     QGridLayout, QSpinBox, QProgressBar, QSplitter, QSystemTrayIcon, QMenu, QMessageBox
 )
-from PyQt6.QtCore import QThread, pyqtSignal, QTimer, Qt, QSharedMemory, QUrl
+from PyQt6.QtCore import (
+    QThread, pyqtSignal, pyqtSlot, QTimer, Qt, QSharedMemory, QUrl, QObject, QRunnable, QThreadPool,
+    QSignalBlocker, QEvent
+)
 from PyQt6.QtGui import QFont, QPalette, QIcon, QAction, QDesktopServices
 
-import serial.tools.list_ports
-from src.core.router_engine import SerialRouterCore
 from src.core.port_enumerator import PortEnumerator, PortType
 from src.gui.resources import resource_manager
 from src.gui.components import RibbonToolbar, ConnectionDiagramWidget, EnhancedStatusWidget, DataFlowMonitorWidget
-from src.gui.components.dialogs.about_dialog import AboutDialog
+
+if TYPE_CHECKING:
+    # Imported on first start_routing() - pyserial and the engine stay off the startup path
+    from src.core.router_engine import SerialRouterCore
+
+CONFIG_FILE = 'serial_router_config.json'
+LOG_MAX_LINES = 2000  # Activity log keeps only the most recent lines
+VIRTUAL_PORT_MANAGER_EXE = r"C:\Program Files (x86)\com0com\Virtual Port Manager\Virtual Port Manager.exe"
+SERIAL_TERMINAL_EXE = r"C:\Program Files (x86)\com0com\Serial Terminal\Serial Terminal.exe"
+BAUD_RATES = ['1200', '2400', '4800', '9600', '19200', '38400', '57600', '115200', '230400', '460800', '921600']
+
+# Minimal combobox stylesheet - transparent background blending with UI
+MINIMAL_COMBO_STYLE = """
+    QComboBox {
+        background-color: transparent;
+        border: 1px solid palette(mid);
+        border-radius: 3px;
+        padding: 3px 8px;
+    }
+    QComboBox:hover {
+        border: 1px solid palette(highlight);
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 2px solid transparent;
+        border-right: 2px solid transparent;
+        border-top: 2px solid palette(text);
+        margin-right: 4px;
+    }
+"""
+
+
+# Last parsed configuration, keyed by path and file mtime - unchanged files skip the JSON parse
+_config_cache: Dict[str, Any] = {"path": None, "mtime_ns": 0, "data": None}
+
+
+def read_config_file(path: str = CONFIG_FILE) -> Dict[str, Any]:
+    """Read configuration, reusing the last parse while the file's mtime is unchanged."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    if _config_cache["path"] == path and _config_cache["mtime_ns"] == mtime_ns:
+        return dict(_config_cache["data"])
+    with open(path, 'rb') as f:
+        data = json.loads(f.read())
+    _config_cache.update(path=path, mtime_ns=mtime_ns, data=data)
+    return dict(data)
+
+
+def write_config_file(config: Dict[str, Any], path: str = CONFIG_FILE):
+    """Write configuration atomically - a crash mid-write never leaves a truncated file."""
+    data = json.dumps(config, indent=2).encode()  # Serialize up front - one write, no handle held while encoding
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
 
 
 class LogHandler(logging.Handler):
-    """Custom logging handler that emits signals for GUI display."""
+    """Custom logging handler that buffers formatted records for the GUI to drain."""
     
-    def __init__(self):
+    def __init__(self, maxlen: int = 5000):
         super().__init__()
-        self.log_signal = None
+        self.buffer = deque(maxlen=maxlen)  # Oldest records dropped if the GUI falls behind
+        self.buffer_lock = threading.Lock()
         
     def emit(self, record):
-        if self.log_signal:
+        try:
             msg = self.format(record)
-            self.log_signal.emit(msg)
+        except Exception:
+            self.handleError(record)
+            return
+        self.push(msg)
+
+    def push(self, message: str):
+        """Queue an already formatted message (safe from any thread)."""
+        with self.buffer_lock:
+            self.buffer.append(message)
+
+    def drain(self) -> list:
+        """Swap out and return all buffered messages."""
+        with self.buffer_lock:
+            if not self.buffer:
+                return []
+            messages = list(self.buffer)
+            self.buffer.clear()
+        return messages
 
 
 class RouterControlThread(QThread):
-    """QThread wrapper for SerialRouterCore operations to prevent GUI blocking."""
+    """
+    Long-lived QThread that runs SerialRouterCore operations to prevent GUI blocking.
+    Operations are queued with set_operation(); request_exit() ends the loop.
+    """
     
-    operation_complete = pyqtSignal(bool, str)  # success, message
+    operation_complete = pyqtSignal(str, bool, str)  # operation, success, message
     
     def __init__(self):
         super().__init__()
-        self.operation = None
-        self.router_core = None
+        self._op_queue = queue.Queue()
         
-    def set_operation(self, operation: str, router_core: SerialRouterCore):
-        """Set the operation to perform: 'start' or 'stop'."""
-        self.operation = operation
-        self.router_core = router_core
+    def set_operation(self, operation: str, router_core: "SerialRouterCore"):
+        """Queue an operation to perform: 'start' or 'stop'."""
+        self._op_queue.put((operation, router_core))
+
+    def request_exit(self):
+        """Ask the loop to exit once queued operations have run."""
+        self._op_queue.put(None)
         
     def run(self):
-        """Execute the router operation in background thread."""
+        """Execute queued router operations until the exit sentinel arrives."""
+        while True:
+            item = self._op_queue.get()
+            if item is None:
+                break
+            operation, router_core = item
+            self._run_operation(operation, router_core)
+            # Critical: Drop router reference to prevent memory leaks
+            item = router_core = None
+
+    def _run_operation(self, operation: str, router_core: "SerialRouterCore"):
+        """Execute a single router operation and report the outcome."""
         try:
-            if self.operation == 'start':
-                success = self.router_core.start()
+            if operation == 'start':
+                success = router_core.start()
                 if success:
-                    self.operation_complete.emit(True, "Router started successfully")
+                    self.operation_complete.emit(operation, True, "Router started successfully")
                 else:
-                    self.operation_complete.emit(False, "Router failed to start - check port connections")
-            elif self.operation == 'stop':
-                self.router_core.stop()
-                self.operation_complete.emit(True, "Router stopped successfully")
+                    self.operation_complete.emit(operation, False, "Router failed to start - check port connections")
+            elif operation == 'stop':
+                router_core.stop()
+                self.operation_complete.emit(operation, True, "Router stopped successfully")
             else:
-                self.operation_complete.emit(False, f"Unknown operation: {self.operation}")
+                self.operation_complete.emit(str(operation), False, f"Unknown operation: {operation}")
                 
         except Exception as e:
-            self.operation_complete.emit(False, f"Operation failed: {str(e)}")
-        finally:
-            # Critical: Clear router reference to prevent memory leaks
-            self.router_core = None
+            self.operation_complete.emit(str(operation), False, f"Operation failed: {str(e)}")
+
+
+class PortScanSignals(QObject):
+    """Signals for PortScanTask."""
+
+    finished = pyqtSignal(list, str)  # ports, error message (empty on success)
+
+
+class PortScanTask(QRunnable):
+    """QRunnable that enumerates serial ports off the GUI thread."""
+
+    def __init__(self, enumerator: PortEnumerator):
+        super().__init__()
+        self.enumerator = enumerator
+        self.signals = PortScanSignals()
+
+    def run(self):
+        """Scan the ports and hand the result back to the GUI thread."""
+        try:
+            self.signals.finished.emit(self.enumerator.enumerate_ports(), "")
+        except Exception as e:
+            self.signals.finished.emit([], str(e))
+
+
+class ThreadWaitSignals(QObject):
+    """Signals for ThreadWaitTask."""
+
+    finished = pyqtSignal()
+    timed_out = pyqtSignal()
+
+
+class ThreadWaitTask(QRunnable):
+    """QRunnable that waits for a QThread to finish so the GUI thread never blocks on it."""
+
+    def __init__(self, thread: QThread, timeout_ms: int):
+        super().__init__()
+        self.thread = thread
+        self.timeout_ms = timeout_ms
+        self.signals = ThreadWaitSignals()
+
+    def run(self):
+        """Wait for the thread and report whether it finished in time."""
+        if self.thread.wait(self.timeout_ms):
+            self.signals.finished.emit()
+        else:
+            self.signals.timed_out.emit()
 
 
 class SerialRouterMainWindow(QMainWindow):
     """Main GUI window for SerialRouter application."""
     
-    # Define signal for log messages
-    log_message_signal = pyqtSignal(str)
+    # Fixed configuration values - get_current_config() layers the UI selections over these
+    _CONFIG_TEMPLATE = MappingProxyType({
+        "timeout": 0.1,
+        "retry_delay_max": 30,
+        "log_level": "INFO"
+    })
+    
+    # Shared activity log formatter - format strings parsed once at import
+    _LOG_FORMATTER = logging.Formatter(
+        '[%(asctime)s] [%(levelname)s] %(message)s',
+        datefmt='%H:%M:%S'
+    )
     
     def __init__(self):
         super().__init__()
         
         # Core components
-        self.router_core: Optional[SerialRouterCore] = None
-        self.control_thread: Optional[RouterControlThread] = None
+        self.router_core: Optional["SerialRouterCore"] = None
+        self.control_thread = RouterControlThread()  # Long-lived worker reused for every start/stop
+        self.control_thread.operation_complete.connect(self.on_operation_complete)
+        self.control_thread.start()
         self.log_handler: Optional[LogHandler] = None
-        self._router_state_lock = threading.Lock()  # Thread synchronisation to prevent concurrent state modification during router operations
-        self._router_state_changing = False
+        self._state_cas = threading.Lock()  # Held while a start/stop operation is in progress - non-blocking acquire acts as test-and-set
         self._initializing = True  # Flag to suppress validation warnings during startup
+        self._port_scan_in_flight = False  # A PortScanTask is running on the thread pool
+        self._forced_rescan_pending = False  # A forced refresh arrived while a scan was in flight
+        self._startup_config_pending = True  # Saved configuration is applied after the first port scan
+        self._last_saved_config: Optional[Dict[str, Any]] = None  # Contents known to be on disk
+        self._shutting_down = False  # perform_shutdown() has started its timer-driven steps
+        self._shutdown_complete = False  # Final shutdown step has run - close events may be accepted
+        self._selected_ports = ("", "COM131", "COM141")  # (incoming, outgoing1, outgoing2)
+        self._last_status_error_time = 0.0  # Monotonic time of the last logged status error
+        self._last_status_ts = 0.0  # Monotonic time of the last status refresh (20 Hz cap)
+        self._status_refresh_pending = False  # A trailing-edge refresh is scheduled
+        self._in_reset_state = False  # True once the monitor shows the offline state - idle ticks skip the reset
+        self._excluded_cache: Optional[frozenset] = None  # Cached _get_excluded_ports() result, cleared on outgoing port change
         
         # Monitoring
+        # Coarse timers - cadence tolerance lets the OS batch their wakeups with other timers
         self.status_timer = QTimer()
+        self.status_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.status_timer.timeout.connect(self.update_status_display)
+        self.log_drain_timer = QTimer()  # Pulls buffered backend log records onto the GUI thread
+        self.log_drain_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.log_drain_timer.timeout.connect(self._flush_pending_log_messages)
 
         # Initialize port enumerator for robust port detection
         self.port_enumerator = PortEnumerator()
         
+        # Built in init_ui - declared first so slots fired during construction can test it
+        self.connection_diagram: Optional[ConnectionDiagramWidget] = None
+        
         # System tray setup
         self.tray_icon = None
         self.setup_system_tray()
         
         # Initialize UI
+        self.setup_logging()  # Before the UI - add_log_message queues through the handler buffer
         self.init_ui()
-        self.setup_logging()
         self.apply_theme()
-        self.refresh_available_ports()
 
-        # Load saved configuration if available
-        self.load_config()
+        # Keep the routed port selection cached for the status tick; rebuilt only on combo changes
+        self.incoming_port_combo.currentTextChanged.connect(self._rebuild_direction_bindings)
+        self.outgoing_port1_combo.currentTextChanged.connect(self._rebuild_direction_bindings)
+        self.outgoing_port2_combo.currentTextChanged.connect(self._rebuild_direction_bindings)
 
-        # Update port tooltips with paired port detection
-        self._update_port_tooltips()
-
-        # Update connection diagram with initial port configuration
-        if self.connection_diagram:
-            port1, port2 = self._get_selected_outgoing_ports()
-            com0com_ports = self.port_enumerator.get_com0com_ports()
-            com0com_names = [p.port_name for p in com0com_ports]
-            self.connection_diagram.set_outgoing_ports(port1, port2, com0com_names)
+        # Scan ports on the thread pool so the window paints first - saved configuration
+        # is applied by _complete_startup_configuration() once the combos are populated
+        self.refresh_available_ports()
 
         # Initialization complete - enable validation warnings
         self._initializing = False
 
-        # Connect log signal to handler
-        self.log_message_signal.connect(self.add_log_message)
+        # Drain backend log records in batches - worker threads never cross into the GUI per record
+        self.log_drain_timer.start(100)
 
-        # Start status monitoring
-        self.status_timer.start(1000)  # 1 second updates
+        # Status monitoring runs only while routing - started/stopped with the UI state
         
     def setup_system_tray(self):
         """Setup system tray icon and menu."""
@@ -169,18 +332,19 @@ class SerialRouterMainWindow(QMainWindow):
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
             self.show_normal()
             
+    @pyqtSlot()
     def show_normal(self):
         """Restore window from tray."""
         self.setWindowState(self.windowState() & ~Qt.WindowState.WindowMinimized)
         self.show()
         self.raise_()
         self.activateWindow()
+        self.update_status_display()  # Ticks were skipped while hidden
         
+    @pyqtSlot()
     def quit_application(self):
-        """Quit the application completely."""
-        if self.tray_icon:
-            self.tray_icon.hide()
-        QApplication.quit()
+        """Quit the application completely - via the full shutdown so the control thread exits first."""
+        self.perform_shutdown()
         
     def init_ui(self):
         """Initialize the user interface."""
@@ -247,35 +411,13 @@ class SerialRouterMainWindow(QMainWindow):
         config_layout = QGridLayout(config_content)
         config_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Minimal combobox stylesheet - transparent background blending with UI
-        minimal_combo_style = """
-            QComboBox {
-                background-color: transparent;
-                border: 1px solid palette(mid);
-                border-radius: 3px;
-                padding: 3px 8px;
-            }
-            QComboBox:hover {
-                border: 1px solid palette(highlight);
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 2px solid transparent;
-                border-right: 2px solid transparent;
-                border-top: 2px solid palette(text);
-                margin-right: 4px;
-            }
-        """
+        # One stylesheet on the container styles all four combos - parsed once, not per widget
+        config_content.setStyleSheet(MINIMAL_COMBO_STYLE)
 
         # Incoming Port Selection
         config_layout.addWidget(QLabel("Incoming Port:"), 0, 0)
         self.incoming_port_combo = QComboBox()
         self.incoming_port_combo.setMinimumWidth(120)
-        self.incoming_port_combo.setStyleSheet(minimal_combo_style)
         # Connect port selection changes to diagram updates
         self.incoming_port_combo.currentTextChanged.connect(self.on_incoming_port_changed)
         config_layout.addWidget(self.incoming_port_combo, 0, 1)
@@ -283,17 +425,16 @@ class SerialRouterMainWindow(QMainWindow):
         # Baud Rate (applies to both incoming and outgoing)
         config_layout.addWidget(QLabel("Baud Rate:"), 1, 0)
         self.baud_spin = QComboBox()
-        self.baud_spin.addItems(['1200', '2400', '4800', '9600', '19200', '38400', '57600', '115200', '230400', '460800', '921600'])
+        # Populated before any slot is connected, so the single addItems() emits nothing of interest
+        self.baud_spin.addItems(BAUD_RATES)
         self.baud_spin.setCurrentText('115200')
         self.baud_spin.setMinimumWidth(120)
-        self.baud_spin.setStyleSheet(minimal_combo_style)
         config_layout.addWidget(self.baud_spin, 1, 1)
 
         # Outgoing Port 1
         config_layout.addWidget(QLabel("Outgoing Port 1:"), 2, 0)
         self.outgoing_port1_combo = QComboBox()
         self.outgoing_port1_combo.setMinimumWidth(120)
-        self.outgoing_port1_combo.setStyleSheet(minimal_combo_style)
         self.outgoing_port1_combo.currentTextChanged.connect(self.on_outgoing_port_changed)
         config_layout.addWidget(self.outgoing_port1_combo, 2, 1)
 
@@ -301,7 +442,6 @@ class SerialRouterMainWindow(QMainWindow):
         config_layout.addWidget(QLabel("Outgoing Port 2:"), 3, 0)
         self.outgoing_port2_combo = QComboBox()
         self.outgoing_port2_combo.setMinimumWidth(120)
-        self.outgoing_port2_combo.setStyleSheet(minimal_combo_style)
         self.outgoing_port2_combo.currentTextChanged.connect(self.on_outgoing_port_changed)
         config_layout.addWidget(self.outgoing_port2_combo, 3, 1)
 
@@ -405,15 +545,10 @@ class SerialRouterMainWindow(QMainWindow):
         # Create vertical splitter for monitoring stats and activity log
         vertical_splitter = QSplitter(Qt.Orientation.Vertical)
         
-        # Top section - Status Monitoring
-        monitoring_widget = QWidget()
-        monitoring_layout = QVBoxLayout(monitoring_widget)
-        monitoring_layout.setSpacing(15)
-        monitoring_layout.setContentsMargins(10, 10, 10, 10)
+        # Top section - Status Monitoring, added directly rather than through a margin-only wrapper
         self.data_flow_monitor = DataFlowMonitorWidget()
-        monitoring_layout.addWidget(self.data_flow_monitor)
-        # Remove stretch from parent - will be handled in child container
-        vertical_splitter.addWidget(monitoring_widget)
+        self.data_flow_monitor.layout().setContentsMargins(20, 20, 20, 20)  # Wrapper's 10px + the monitor's own 10px
+        vertical_splitter.addWidget(self.data_flow_monitor)
         
         # Bottom section - Activity Log
         log_widget = QWidget()
@@ -433,26 +568,32 @@ class SerialRouterMainWindow(QMainWindow):
         self.ribbon.stop_routing.connect(self.stop_routing)
         self.ribbon.configure_ports.connect(self.show_port_configuration)
         self.ribbon.launch_terminal.connect(self.launch_terminal)
-        self.ribbon.refresh_ports.connect(self.refresh_available_ports)
+        self.ribbon.refresh_ports.connect(self.on_refresh_ports_requested)
         self.ribbon.view_stats.connect(self.show_routing_stats)
         self.ribbon.clear_log.connect(self.clear_activity_log)
         self.ribbon.show_help.connect(self.show_help_information)
         self.ribbon.show_about.connect(self.show_about_dialog)
     
+    @pyqtSlot()
     def show_port_configuration(self):
         """Launch com0com setup utility."""
+        if not os.path.exists(VIRTUAL_PORT_MANAGER_EXE):
+            self.add_log_message(f"Could not launch setup utility: not found at {VIRTUAL_PORT_MANAGER_EXE}")
+            return
         try:
-            subprocess.Popen([r"C:\Program Files (x86)\com0com\Virtual Port Manager\Virtual Port Manager.exe"],
-                            creationflags=subprocess.DETACHED_PROCESS)
+            subprocess.Popen([VIRTUAL_PORT_MANAGER_EXE], creationflags=subprocess.DETACHED_PROCESS)
             self.add_log_message("Launched com0com setup utility")
         except Exception as e:
             self.add_log_message(f"Could not launch setup utility: {str(e)}")
 
+    @pyqtSlot()
     def launch_terminal(self):
         """Launch serial terminal application."""
+        if not os.path.exists(SERIAL_TERMINAL_EXE):
+            self.add_log_message(f"Could not launch serial terminal: not found at {SERIAL_TERMINAL_EXE}")
+            return
         try:
-            subprocess.Popen([r"C:\Program Files (x86)\com0com\Serial Terminal\Serial Terminal.exe"],
-                            creationflags=subprocess.DETACHED_PROCESS)
+            subprocess.Popen([SERIAL_TERMINAL_EXE], creationflags=subprocess.DETACHED_PROCESS)
             self.add_log_message("Launched serial terminal")
         except Exception as e:
             self.add_log_message(f"Could not launch serial terminal: {str(e)}")
@@ -518,6 +659,7 @@ class SerialRouterMainWindow(QMainWindow):
         except Exception as e:
             self.add_log_message(f"Port analysis error: {str(e)}")
     
+    @pyqtSlot()
     def show_routing_stats(self):
         """Show historical performance and reliability statistics."""
         if not self.router_core:
@@ -530,13 +672,12 @@ class SerialRouterMainWindow(QMainWindow):
             self.add_log_message("=== Router Performance Report ===")
             
             # Data transfer totals
-            bytes_transferred = status.get('bytes_transferred', {})
-            for direction, bytes_count in bytes_transferred.items():
-                if isinstance(bytes_count, int):
-                    if bytes_count > 1024:
-                        self.add_log_message(f"Total {direction}: {bytes_count:,} bytes ({bytes_count/1024:.1f} KB)")
-                    else:
-                        self.add_log_message(f"Total {direction}: {bytes_count} bytes")
+            direction_bytes = status.get('direction_bytes', {})
+            for direction, bytes_count in direction_bytes.items():
+                line = f"Total {direction}: {bytes_count:,} bytes"
+                if bytes_count > 1024:
+                    line += f" ({bytes_count/1024:.1f} KB)"
+                self.add_log_message(line)
             
             # Performance metrics
             critical_metrics = status.get('critical_metrics', {})
@@ -544,11 +685,7 @@ class SerialRouterMainWindow(QMainWindow):
             self.add_log_message(f"Peak throughput: {peak_bps:,} bps")
             
             # Reliability
-            restart_counts = status.get('thread_restart_counts', {})
-            total_restarts = 0
-            for key, value in restart_counts.items():
-                if isinstance(value, int):
-                    total_restarts += value
+            total_restarts = status.get('total_thread_restarts', 0)
             self.add_log_message(f"Thread restarts: {total_restarts} total")
             
             # Runtime
@@ -558,6 +695,7 @@ class SerialRouterMainWindow(QMainWindow):
         except Exception as e:
             self.add_log_message(f"Could not retrieve statistics: {str(e)}")
     
+    @pyqtSlot()
     def show_help_information(self):
         """Show help dialog with user choice."""
         # Show dialog
@@ -607,18 +745,25 @@ class SerialRouterMainWindow(QMainWindow):
         self.add_log_message(" ║ • Configure incoming port before starting operations             ║")
         self.add_log_message(" ╚══════════════════════════════════════════════════════════════════╝")
 
+    @pyqtSlot()
     def show_about_dialog(self):
         """Show the About dialog."""
+        # Imported on first use - the dialog isn't needed to bring up the main window
+        from src.gui.components.dialogs.about_dialog import AboutDialog
         AboutDialog.show_about(self)
 
+    @pyqtSlot(str)
     def on_incoming_port_changed(self, port_name: str):
         """Handle incoming port selection changes."""
-        if hasattr(self, 'connection_diagram') and port_name:
-            if self.connection_diagram:
-                self.connection_diagram.set_incoming_port(port_name)
+        if self.connection_diagram is not None and port_name:
+            self.connection_diagram.set_incoming_port(port_name)
 
+    @pyqtSlot()
     def on_outgoing_port_changed(self):
         """Handle outgoing port selection changes - validate and update diagram."""
+        # Outgoing selection drives the excluded port set
+        self._excluded_cache = None
+
         if not hasattr(self, 'outgoing_port1_combo') or not hasattr(self, 'outgoing_port2_combo'):
             return
 
@@ -636,6 +781,13 @@ class SerialRouterMainWindow(QMainWindow):
             com0com_names = [p.port_name for p in com0com_ports]
             self.connection_diagram.set_outgoing_ports(port1, port2, com0com_names)
 
+    @pyqtSlot()
+    def _rebuild_direction_bindings(self):
+        """Cache the selected ports and push them to the monitor when the selection changes."""
+        port1, port2 = self._get_selected_outgoing_ports()
+        self._selected_ports = (self.incoming_port_combo.currentText(), port1, port2)
+        self.data_flow_monitor.set_port_configuration(*self._selected_ports)
+
     def _get_selected_outgoing_ports(self):
         """Returns currently selected outgoing ports from UI dropdowns."""
         if hasattr(self, 'outgoing_port1_combo') and hasattr(self, 'outgoing_port2_combo'):
@@ -694,11 +846,15 @@ class SerialRouterMainWindow(QMainWindow):
         except:
             return "Unknown"
 
-    def _get_excluded_ports(self) -> set:
+    def _get_excluded_ports(self) -> frozenset:
         """
         Get ports that should be excluded from incoming port selection.
         Returns the currently selected outgoing ports plus their likely paired ports.
+        Result is cached until the outgoing port selection changes.
         """
+        if self._excluded_cache is not None:
+            return self._excluded_cache
+
         excluded = set()
         port1, port2 = self._get_selected_outgoing_ports()
 
@@ -721,7 +877,8 @@ class SerialRouterMainWindow(QMainWindow):
             # If parsing fails, fall back to default reserved ports
             excluded.update({"COM131", "COM132", "COM141", "COM142"})
 
-        return excluded
+        self._excluded_cache = frozenset(excluded)
+        return self._excluded_cache
 
     def validate_port_configuration(self) -> bool:
         """Validate current port configuration."""
@@ -791,8 +948,11 @@ class SerialRouterMainWindow(QMainWindow):
         log_layout = QVBoxLayout(log_content)
 
         # Log display
-        self.activity_log = QTextEdit()
+        # Plain-text editor - append-only log needs no rich-text document model
+        self.activity_log = QPlainTextEdit()
         self.activity_log.setReadOnly(True)
+        # Bound document size so append/re-layout cost stays flat over long sessions
+        self.activity_log.setMaximumBlockCount(LOG_MAX_LINES)
 
         # Set monospace font for proper Unicode box-drawing character alignment
         # IMPORTANT: Use monospace font here even when UI font is applied globally
@@ -801,7 +961,7 @@ class SerialRouterMainWindow(QMainWindow):
 
         # Ultra clean minimal design - match main window background, no border
         self.activity_log.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: palette(window);
                 border: none;
             }
@@ -817,41 +977,112 @@ class SerialRouterMainWindow(QMainWindow):
     def setup_logging(self):
         """Setup custom logging handler for activity log."""
         self.log_handler = LogHandler()
-        self.log_handler.log_signal = self.log_message_signal
-        
-        formatter = logging.Formatter(
-            '[%(asctime)s] [%(levelname)s] %(message)s',
-            datefmt='%H:%M:%S'
-        )
-        self.log_handler.setFormatter(formatter)
+        self.log_handler.setFormatter(self._LOG_FORMATTER)
         
+    @pyqtSlot()
+    def _flush_pending_log_messages(self):
+        """Append all buffered log messages to the activity log in one call."""
+        messages = self.log_handler.drain()
+        if messages:
+            self._write_activity_log("\n".join(messages))
+
+    @pyqtSlot(str)
     def add_log_message(self, message: str):
-        """Add a message to the activity log."""
-        self.activity_log.append(message)
+        """Add a message to the activity log - written in order with backend records on the next drain tick."""
+        self.log_handler.push(message)
+
+    def _write_activity_log(self, message: str):
+        """Append text to the activity log widget, keeping the view pinned to the bottom."""
+        # Follow new output only if the user hasn't scrolled back through the log
+        scrollbar = self.activity_log.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+
+        self.activity_log.appendPlainText(message)
         
         # Auto-scroll to bottom
-        scrollbar = self.activity_log.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
         
-    def refresh_available_ports(self):
-        """Refresh the list of available COM ports using enhanced port enumerator."""
+    @pyqtSlot()
+    def on_refresh_ports_requested(self):
+        """Handle explicit Refresh Ports click - always rescan rather than reuse the cached scan."""
+        self.refresh_available_ports(force=True)
+
+    def refresh_available_ports(self, force: bool = False):
+        """Refresh the list of available COM ports - scanned on a pool thread so the GUI never stalls."""
+        if self._port_scan_in_flight:
+            # The running scan may predate the user's click - rescan fresh once it lands
+            if force:
+                self._forced_rescan_pending = True
+            return
+        self._port_scan_in_flight = True
+
+        if force:
+            self.port_enumerator.invalidate_cache()
+        task = PortScanTask(self.port_enumerator)
+        task.signals.finished.connect(self._on_port_scan_finished)
+        QThreadPool.globalInstance().start(task)
+
+    @pyqtSlot(list, str)
+    def _on_port_scan_finished(self, all_ports: list, error: str):
+        """Apply a background port scan to the combo boxes (runs on the GUI thread)."""
+        self._port_scan_in_flight = False
+        if error:
+            self.add_log_message(f"Error scanning ports: {error}")
+            self.add_log_message("Port scan failed - click Refresh Ports to retry")
+        else:
+            self._apply_port_list(all_ports)
+
+        if self._startup_config_pending:
+            self._startup_config_pending = False
+            self._complete_startup_configuration()
+
+        if self._forced_rescan_pending:
+            self._forced_rescan_pending = False
+            self.refresh_available_ports(force=True)
+
+    def _complete_startup_configuration(self):
+        """Apply saved configuration once the first port scan has populated the combos."""
+        self._initializing = True
+        try:
+            # Load saved configuration if available
+            self.load_config()
+
+            # Update port tooltips with paired port detection
+            self._update_port_tooltips()
+
+            # Update connection diagram with initial port configuration
+            if self.connection_diagram:
+                port1, port2 = self._get_selected_outgoing_ports()
+                com0com_ports = self.port_enumerator.get_com0com_ports()
+                com0com_names = [p.port_name for p in com0com_ports]
+                self.connection_diagram.set_outgoing_ports(port1, port2, com0com_names)
+
+            self._rebuild_direction_bindings()
+        finally:
+            self._initializing = False
+
+    def _apply_port_list(self, all_ports: list):
+        """Populate the port combo boxes from an enumerated port list."""
         # Suppress validation warnings while repopulating combo boxes
         self._initializing = True
 
         current_port = self.incoming_port_combo.currentText()
-        current_out1 = self.outgoing_port1_combo.currentText() if hasattr(self, 'outgoing_port1_combo') else ""
-        current_out2 = self.outgoing_port2_combo.currentText() if hasattr(self, 'outgoing_port2_combo') else ""
+        current_out1 = self.outgoing_port1_combo.currentText()
+        current_out2 = self.outgoing_port2_combo.currentText()
+
+        # Silence per-mutation change signals while repopulating - handlers run once at the end
+        blockers = [
+            QSignalBlocker(self.incoming_port_combo),
+            QSignalBlocker(self.outgoing_port1_combo),
+            QSignalBlocker(self.outgoing_port2_combo)
+        ]
 
         self.incoming_port_combo.clear()
-        if hasattr(self, 'outgoing_port1_combo'):
-            self.outgoing_port1_combo.clear()
-        if hasattr(self, 'outgoing_port2_combo'):
-            self.outgoing_port2_combo.clear()
+        self.outgoing_port1_combo.clear()
+        self.outgoing_port2_combo.clear()
         
         try:
-            # Use our robust port enumerator
-            all_ports = self.port_enumerator.enumerate_ports()
-
             if not all_ports:
                 # No ports available - show placeholder and inform user
                 self.incoming_port_combo.addItem("")
@@ -909,29 +1140,28 @@ class SerialRouterMainWindow(QMainWindow):
                 self.incoming_port_combo.addItem("COM Not Found")
             
             # Populate outgoing port dropdowns with com0com ports only
-            if hasattr(self, 'outgoing_port1_combo') and hasattr(self, 'outgoing_port2_combo'):
-                com0com_ports = self.port_enumerator.get_com0com_ports()
-                com0com_names = [p.port_name for p in com0com_ports]
+            # Reuse the scan above rather than enumerating again
+            com0com_names = [p.port_name for p in com0com_ports]
 
-                if com0com_names:
-                    self.outgoing_port1_combo.addItems(com0com_names)
-                    self.outgoing_port2_combo.addItems(com0com_names)
+            if com0com_names:
+                self.outgoing_port1_combo.addItems(com0com_names)
+                self.outgoing_port2_combo.addItems(com0com_names)
 
-                    # Set defaults: restore previous or use COM131/COM141
-                    if current_out1 and current_out1 in com0com_names:
-                        self.outgoing_port1_combo.setCurrentText(current_out1)
-                    elif "COM131" in com0com_names:
-                        self.outgoing_port1_combo.setCurrentText("COM131")
+                # Set defaults: restore previous or use COM131/COM141
+                if current_out1 and current_out1 in com0com_names:
+                    self.outgoing_port1_combo.setCurrentText(current_out1)
+                elif "COM131" in com0com_names:
+                    self.outgoing_port1_combo.setCurrentText("COM131")
 
-                    if current_out2 and current_out2 in com0com_names:
-                        self.outgoing_port2_combo.setCurrentText(current_out2)
-                    elif "COM141" in com0com_names:
-                        self.outgoing_port2_combo.setCurrentText("COM141")
-                else:
-                    # No com0com ports found - add defaults anyway
-                    self.outgoing_port1_combo.addItems(["COM131"])
-                    self.outgoing_port2_combo.addItems(["COM141"])
-                    self.add_log_message("Warning: No com0com ports detected - using defaults")
+                if current_out2 and current_out2 in com0com_names:
+                    self.outgoing_port2_combo.setCurrentText(current_out2)
+                elif "COM141" in com0com_names:
+                    self.outgoing_port2_combo.setCurrentText("COM141")
+            else:
+                # No com0com ports found - add defaults anyway
+                self.outgoing_port1_combo.addItems(["COM131"])
+                self.outgoing_port2_combo.addItems(["COM141"])
+                self.add_log_message("Warning: No com0com ports detected - using defaults")
 
             # Report findings with port type details
             total_ports = len(all_ports)
@@ -958,6 +1188,20 @@ class SerialRouterMainWindow(QMainWindow):
             self.incoming_port_combo.addItem("(Port scan failed)")
             self.add_log_message("Port scan failed - click Refresh Ports to retry")
         finally:
+            for blocker in blockers:
+                blocker.unblock()
+            # Notify only roles whose selection actually changed - at most once per role,
+            # since the outgoing handlers read both outgoing combos
+            new_port = self.incoming_port_combo.currentText()
+            if new_port != current_port:
+                self.incoming_port_combo.currentTextChanged.emit(new_port)
+            new_out1 = self.outgoing_port1_combo.currentText()
+            new_out2 = self.outgoing_port2_combo.currentText()
+            if new_out1 != current_out1:
+                self.outgoing_port1_combo.currentTextChanged.emit(new_out1)
+            elif new_out2 != current_out2:
+                self.outgoing_port2_combo.currentTextChanged.emit(new_out2)
+
             # Re-enable validation warnings after refresh is complete
             self._initializing = False
 
@@ -1029,6 +1273,7 @@ class SerialRouterMainWindow(QMainWindow):
         """Check if routing is currently active."""
         return self.router_core is not None and self.router_core.running
         
+    @pyqtSlot()
     def start_routing(self):
         """Start the serial routing process."""
         # Check if incoming port is selected
@@ -1045,15 +1290,14 @@ class SerialRouterMainWindow(QMainWindow):
             self.add_log_message("Cannot start: Invalid port configuration")
             return
             
-        with self._router_state_lock:  # Ensure atomic state change to prevent concurrent router operations
-            if self._router_state_changing:
-                return  # Operation already in progress
-            self._router_state_changing = True
+        if not self._state_cas.acquire(blocking=False):
+            return  # Operation already in progress
         try:
             # Apply current configuration
             config = self.get_current_config()
 
             # Initialize router core with GUI values
+            from src.core.router_engine import SerialRouterCore
             self.router_core = SerialRouterCore(
                 incoming_port=config["incoming_port"],
                 incoming_baud=config["incoming_baud"],
@@ -1067,23 +1311,8 @@ class SerialRouterMainWindow(QMainWindow):
                 
             self.add_log_message(f"Starting router: {config['incoming_port']} <-> {config['outgoing_ports'][0]} & {config['outgoing_ports'][1]}")
             
-            # Clean up existing thread first to prevent leaks
-            if hasattr(self, 'control_thread') and self.control_thread:
-                if self.control_thread.isRunning():
-                    self.control_thread.quit()
-                    if not self.control_thread.wait(3000):
-                        self.add_log_message("WARNING: Control thread did not terminate cleanly")
-                        self.control_thread.terminate()
-                        self.control_thread.wait(1000)
-                # Proper cleanup: ensure thread is fully stopped before clearing reference
-                self.control_thread.deleteLater()  # Qt cleanup for thread object
-                self.control_thread = None
-            
             # Start router in background thread
-            self.control_thread = RouterControlThread()
-            self.control_thread.operation_complete.connect(self.on_operation_complete)
             self.control_thread.set_operation('start', self.router_core)
-            self.control_thread.start()
             
             # Update UI state
             self.set_ui_state_starting()
@@ -1091,68 +1320,54 @@ class SerialRouterMainWindow(QMainWindow):
         except Exception as e:
             self.add_log_message(f"Failed to start routing: {str(e)}")
             self.cleanup_router_core()
-            self._router_state_changing = False
+            self._state_cas.release()
             
+    @pyqtSlot()
     def stop_routing(self):
         """Stop the serial routing process."""
         if not self.router_core:
             return
             
-        with self._router_state_lock:  # Ensure atomic state change to prevent concurrent router operations
-            if self._router_state_changing:
-                return  # Operation already in progress
-            self._router_state_changing = True
+        if not self._state_cas.acquire(blocking=False):
+            return  # Operation already in progress
         self.add_log_message("Stopping serial routing...")
         
         try:
-            # Clean up existing thread first to prevent leaks
-            if hasattr(self, 'control_thread') and self.control_thread:
-                if self.control_thread.isRunning():
-                    self.control_thread.quit()
-                    if not self.control_thread.wait(3000):
-                        self.add_log_message("WARNING: Control thread did not terminate cleanly")
-                        self.control_thread.terminate()
-                        self.control_thread.wait(1000)
-                # Proper cleanup: ensure thread is fully stopped before clearing reference
-                self.control_thread.deleteLater()  # Qt cleanup for thread object
-                self.control_thread = None
-            
             # Stop router in background thread
-            self.control_thread = RouterControlThread()
-            self.control_thread.operation_complete.connect(self.on_operation_complete)
             self.control_thread.set_operation('stop', self.router_core)
-            self.control_thread.start()
             
             # Update UI state
             self.set_ui_state_stopping()
             
         except Exception as e:
             self.add_log_message(f"Error stopping routing: {str(e)}")
-            self._router_state_changing = False
+            self._state_cas.release()
             
-    def on_operation_complete(self, success: bool, message: str):
+    @pyqtSlot(str, bool, str)
+    def on_operation_complete(self, operation: str, success: bool, message: str):
         """Handle completion of router operations."""
         self.add_log_message(message)
         
         if success:
-            if "started" in message.lower():
+            if operation == 'start':
                 self.set_ui_state_running()
-                self._router_state_changing = False
-            elif "stopped" in message.lower():
+                self._state_cas.release()
+            elif operation == 'stop':
                 self.set_ui_state_stopped()
                 self.cleanup_router_core()
-                self._router_state_changing = False
+                self._state_cas.release()
         else:
             # Operation failed, show error state then transition to stopped
             self.enhanced_status.set_state(EnhancedStatusWidget.STATE_ERROR)
             # After a brief delay, transition to stopped state
             QTimer.singleShot(2000, self._handle_failed_operation)  # Direct method reference prevents reference issues
             
+    @pyqtSlot()
     def _handle_failed_operation(self):
         """Handle failed router operations with proper cleanup."""
         self.set_ui_state_stopped()
         self.cleanup_router_core()
-        self._router_state_changing = False
+        self._state_cas.release()
             
     def set_ui_state_starting(self):
         """Set UI to starting state."""
@@ -1173,7 +1388,17 @@ class SerialRouterMainWindow(QMainWindow):
 
         # Update connection diagram with active state
         self.update_connection_diagram_state()
+
+        # Start status monitoring - fast for the first seconds so startup feedback is immediate
+        self.status_timer.start(500)
+        QTimer.singleShot(5000, self._relax_status_interval)
         
+    @pyqtSlot()
+    def _relax_status_interval(self):
+        """Drop status monitoring to the steady 1 second rate once routing has settled."""
+        if self.status_timer.isActive():
+            self.status_timer.setInterval(1000)  # 1 second updates
+
     def set_ui_state_stopping(self):
         """Set UI to stopping state."""
         self.ribbon.set_routing_state(False)
@@ -1186,6 +1411,10 @@ class SerialRouterMainWindow(QMainWindow):
         self.ribbon.set_busy(False)
         self.enhanced_status.set_state(EnhancedStatusWidget.STATE_OFFLINE)
 
+        # No router to poll while stopped - one final tick shows the offline state
+        self.status_timer.stop()
+        self.update_status_display()
+
         # Unlock port configuration when routing stops
         self.incoming_port_combo.setEnabled(True)
         self.outgoing_port1_combo.setEnabled(True)
@@ -1199,23 +1428,29 @@ class SerialRouterMainWindow(QMainWindow):
                 port2: False
             })
         
-    def update_connection_diagram_state(self):
-        """Update connection diagram based on current router status."""
+    def update_connection_diagram_state(self, status: Optional[Dict[str, Any]] = None,
+                                        port1: Optional[str] = None, port2: Optional[str] = None):
+        """
+        Update connection diagram based on current router status.
+        Callers that already hold a status snapshot and the selected ports pass them in
+        to avoid a second get_status() and combo read per tick.
+        """
         if not self.router_core:
             return
-            
+
+        if port1 is None or port2 is None:
+            port1, port2 = self._get_selected_outgoing_ports()
+
         try:
-            status = self.router_core.get_status()
+            if status is None:
+                status = self.router_core.get_status()
             port_connections = status.get("port_connections", {})
 
             # Update connection states based on actual port status
-            port1, port2 = self._get_selected_outgoing_ports()
             connection_states = {}
-            for port in [port1, port2]:
-                if port in port_connections:
-                    connection_states[port] = port_connections[port].get("connected", False)
-                else:
-                    connection_states[port] = False
+            for port in (port1, port2):
+                port_info = port_connections.get(port)
+                connection_states[port] = port_info.get("connected", False) if port_info else False
 
             if self.connection_diagram:
                 self.connection_diagram.set_connection_states(connection_states)
@@ -1223,64 +1458,86 @@ class SerialRouterMainWindow(QMainWindow):
         except Exception as e:
             # Fallback to basic active state
             if self.connection_diagram:
-                port1, port2 = self._get_selected_outgoing_ports()
                 self.connection_diagram.set_connection_states({
                     port1: True,
                     port2: True
                 })
         
+    @pyqtSlot()
     def update_status_display(self):
         """Update the real-time status display with advanced metrics."""
-        if not self.router_core or self._router_state_changing:
-            # Reset displays when not running
+        if not self.router_core or self._state_cas.locked():
+            # Reset displays when not running - only once per transition to idle
+            if self._in_reset_state:
+                return
             self.data_flow_monitor.reset_display()
+            self._in_reset_state = True
             return
 
+        self._in_reset_state = False
+
+        # Nobody can see the monitor while hidden to tray or minimized - refreshed on restore
+        if not self.isVisible() or self.isMinimized():
+            return
+
+        # Cap refreshes at 20 Hz regardless of how often the slot is invoked - a call landing
+        # inside the window is deferred to its end (trailing edge) so the latest state still shows
+        now = time.monotonic()
+        elapsed = now - self._last_status_ts
+        if elapsed < 0.05:
+            if not self._status_refresh_pending:
+                self._status_refresh_pending = True
+                QTimer.singleShot(max(1, int((0.05 - elapsed) * 1000)), self._run_pending_status_refresh)
+            return
+        self._last_status_ts = now
+
         try:
             status = self.router_core.get_status()
 
+            # Selected ports are cached on combo changes - no widget reads per tick
+            _, port1, port2 = self._selected_ports
+
             # Update connection diagram state (stays in main_window)
-            self.update_connection_diagram_state()
+            self.update_connection_diagram_state(status, port1, port2)
 
-            # Delegate all stats display to monitor widget
-            incoming_port = self.incoming_port_combo.currentText()
-            port1, port2 = self._get_selected_outgoing_ports()
-            self.data_flow_monitor.update_display(status, incoming_port, port1, port2)
+            # Delegate all stats display to monitor widget (port configuration already applied)
+            self.data_flow_monitor.update_display(status)
 
         except Exception as e:
-            # Log critical errors
-            self.add_log_message(f"Status update error: {str(e)}")
+            # Log critical errors, at most once every 30 seconds - clock read only on failure
+            now = time.monotonic()
+            if now - self._last_status_error_time > 30:
+                self._last_status_error_time = now
+                self.add_log_message(f"Status update error: {str(e)}")
             
+    @pyqtSlot()
+    def _run_pending_status_refresh(self):
+        """Trailing-edge status refresh for a call that arrived inside the throttle window."""
+        self._status_refresh_pending = False
+        self.update_status_display()
+
     def get_current_config(self) -> Dict[str, Any]:
         """Get current configuration from UI controls."""
-        outgoing_ports = []
-        if hasattr(self, 'outgoing_port1_combo') and hasattr(self, 'outgoing_port2_combo'):
-            outgoing_ports = [
-                self.outgoing_port1_combo.currentText(),
-                self.outgoing_port2_combo.currentText()
-            ]
-        else:
-            outgoing_ports = ["COM131", "COM141"]  # Fallback
-
+        # Port selections are already cached by _rebuild_direction_bindings on every combo change
+        incoming_port, port1, port2 = self._selected_ports
+        baud = int(self.baud_spin.currentText())
         return {
-            "incoming_port": self.incoming_port_combo.currentText(),
-            "incoming_baud": int(self.baud_spin.currentText()),
-            "outgoing_baud": int(self.baud_spin.currentText()),
-            "outgoing_ports": outgoing_ports,
-            "timeout": 0.1,
-            "retry_delay_max": 30,
-            "log_level": "INFO"
+            "incoming_port": incoming_port,
+            "incoming_baud": baud,
+            "outgoing_baud": baud,
+            "outgoing_ports": [port1, port2],
+            **self._CONFIG_TEMPLATE
         }
 
     def load_config(self):
         """Load configuration from file with validation."""
         try:
-            with open('serial_router_config.json', 'r') as f:
-                self.config = json.load(f)  # Store as instance variable
+            self.config = read_config_file()  # Store as instance variable
+            self._last_saved_config = dict(self.config)  # File already holds these values
 
-            # Get list of available com0com ports for validation
-            com0com_ports = self.port_enumerator.get_com0com_ports()
-            available_port_names = [p.port_name for p in com0com_ports]
+            # Combo signals are blocked while applying saved ports so the change
+            # handler (validation, tooltips, diagram) runs once at the end
+            ports_applied = False
 
             # Apply saved outgoing port 1 with validation
             if 'outgoing_port1' in self.config and hasattr(self, 'outgoing_port1_combo'):
@@ -1288,7 +1545,9 @@ class SerialRouterMainWindow(QMainWindow):
                 index = self.outgoing_port1_combo.findText(port1)
                 if index >= 0:
                     # Port exists in dropdown, apply it
-                    self.outgoing_port1_combo.setCurrentIndex(index)
+                    with QSignalBlocker(self.outgoing_port1_combo):
+                        self.outgoing_port1_combo.setCurrentIndex(index)
+                    ports_applied = True
                 else:
                     # Port no longer exists
                     self.add_log_message(f"Warning: Saved port {port1} no longer available, using default")
@@ -1299,11 +1558,16 @@ class SerialRouterMainWindow(QMainWindow):
                 index = self.outgoing_port2_combo.findText(port2)
                 if index >= 0:
                     # Port exists in dropdown, apply it
-                    self.outgoing_port2_combo.setCurrentIndex(index)
+                    with QSignalBlocker(self.outgoing_port2_combo):
+                        self.outgoing_port2_combo.setCurrentIndex(index)
+                    ports_applied = True
                 else:
                     # Port no longer exists
                     self.add_log_message(f"Warning: Saved port {port2} no longer available, using default")
 
+            if ports_applied:
+                self.on_outgoing_port_changed()
+
             self.add_log_message("Configuration loaded from file")
 
         except FileNotFoundError:
@@ -1313,7 +1577,11 @@ class SerialRouterMainWindow(QMainWindow):
             self.config = {}  # Initialize empty config on error
 
     def save_config(self):
-        """Save current configuration to file."""
+        """Save current configuration to file, skipping the write when nothing changed."""
+        # Combos are still empty until the startup scan applies the saved configuration
+        if self._startup_config_pending:
+            return
+
         try:
             if not hasattr(self, 'config'):
                 self.config = {}
@@ -1324,30 +1592,50 @@ class SerialRouterMainWindow(QMainWindow):
             if hasattr(self, 'outgoing_port2_combo'):
                 self.config['outgoing_port2'] = self.outgoing_port2_combo.currentText()
 
-            with open('serial_router_config.json', 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Nothing changed since the last write - skip serialization and disk I/O
+            if self.config == self._last_saved_config:
+                return
+
+            write_config_file(self.config)
+            self._last_saved_config = dict(self.config)
 
         except Exception as e:
             self.add_log_message(f"Error saving configuration: {e}")
         
             
+    @pyqtSlot()
     def clear_activity_log(self):
         """Clear the activity log."""
+        # Discard messages still waiting for the drain tick so they don't reappear after the clear
+        self.log_handler.drain()
         self.activity_log.clear()
         self.add_log_message("Activity log cleared")
         
+    def changeEvent(self, event):
+        """Refresh the status display immediately when the window is restored from minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and not self.isMinimized():
+            self.update_status_display()
+
     def closeEvent(self, event):
         """Handle application close event - minimize to tray or quit based on user choice."""
+        # Shutdown runs asynchronously - hold the window open until its final step quits the app
+        if self._shutting_down:
+            if self._shutdown_complete:
+                event.accept()
+            else:
+                event.ignore()
+            return
+
         # CRITICAL FIX: Add confirmation dialog to allow proper closing
         # Holding Shift while closing will quit directly without prompting
         if event.spontaneous() and self.tray_icon and self.tray_icon.isVisible():
             # Check if Shift key is held - if so, quit directly
             modifiers = QApplication.keyboardModifiers()
             if modifiers & Qt.KeyboardModifier.ShiftModifier:
-                # Shift held - quit directly
+                # Shift held - quit directly (shutdown quits the application when finished)
                 self.perform_shutdown()
-                event.accept()
-                QApplication.quit()
+                event.ignore()
                 return
 
             # Ask user what they want to do with custom button labels
@@ -1378,20 +1666,28 @@ class SerialRouterMainWindow(QMainWindow):
                 )
                 event.ignore()
             elif clicked_button == quit_button:
-                # Quit completely
+                # Quit completely (shutdown quits the application when finished)
                 self.perform_shutdown()
-                event.accept()
-                QApplication.quit()
+                event.ignore()
             else:
                 # Cancel - Do nothing
                 event.ignore()
         else:
             # No tray available or programmatic close, perform full shutdown
             self.perform_shutdown()
-            event.accept()
+            event.ignore()
             
+    @pyqtSlot()
     def perform_shutdown(self):
-        """Perform complete application shutdown."""
+        """
+        Perform complete application shutdown.
+
+        Runs as a chain of single-shot timer steps so the event loop keeps draining
+        while the router and control thread wind down; the final step quits the app.
+        """
+        if self._shutting_down:
+            return
+        self._shutting_down = True
         self.add_log_message("Application shutdown initiated...")
         
         # Stop status timer first to prevent updates during shutdown
@@ -1403,21 +1699,41 @@ class SerialRouterMainWindow(QMainWindow):
             if self.router_core:
                 try:
                     self.router_core.stop()
-                    # Give router time to clean up
-                    QApplication.processEvents()
-                    time.sleep(0.5)
                 except Exception as e:
                     self.add_log_message(f"Error during router shutdown: {str(e)}")
-                
-        # Clean up control thread with force termination if needed
+            # Give router time to clean up without blocking the event loop
+            QTimer.singleShot(500, self._shutdown_wait_control_thread)
+        else:
+            QTimer.singleShot(0, self._shutdown_wait_control_thread)
+
+    @pyqtSlot()
+    def _shutdown_wait_control_thread(self):
+        """Shutdown step 2: let the control thread finish, waiting on a pool thread."""
         if self.control_thread and self.control_thread.isRunning():
             self.add_log_message("Waiting for control thread to terminate...")
-            self.control_thread.quit()
-            if not self.control_thread.wait(5000):  # Wait up to 5 seconds
-                self.add_log_message("Force terminating control thread...")
-                self.control_thread.terminate()
-                self.control_thread.wait(2000)
-                
+            self.control_thread.request_exit()
+            task = ThreadWaitTask(self.control_thread, 5000)  # Wait up to 5 seconds
+            task.signals.finished.connect(self._finalize_shutdown)
+            task.signals.timed_out.connect(self._on_control_thread_wait_timeout)
+            QThreadPool.globalInstance().start(task)
+            return
+
+        self._finalize_shutdown()
+
+    @pyqtSlot()
+    def _on_control_thread_wait_timeout(self):
+        """Force-terminate a control thread that ignored the shutdown request."""
+        self.add_log_message("Force terminating control thread...")
+        self.control_thread.terminate()
+        # terminate() is asynchronous - confirm on a pool thread, then finish shutdown either way
+        task = ThreadWaitTask(self.control_thread, 2000)
+        task.signals.finished.connect(self._finalize_shutdown)
+        task.signals.timed_out.connect(self._finalize_shutdown)
+        QThreadPool.globalInstance().start(task)
+
+    @pyqtSlot()
+    def _finalize_shutdown(self):
+        """Shutdown step 3: persist configuration, release resources and quit."""
         # Save configuration before exit
         self.save_config()
 
@@ -1426,15 +1742,16 @@ class SerialRouterMainWindow(QMainWindow):
         if self.tray_icon:
             self.tray_icon.hide()
         self.add_log_message("Application shutdown complete")
+        self._flush_pending_log_messages()  # The drain timer won't fire again once the loop quits
+        self._shutdown_complete = True
+        QApplication.quit()
     
     def apply_theme(self):
         """Apply the Windows theme to the application."""
         theme_css = resource_manager.load_theme()
         if theme_css:
+            # setStyleSheet already repolishes the widget tree - no explicit unpolish/polish pass
             self.setStyleSheet(theme_css)
-            # Force style refresh for all widgets with custom properties
-            self.style().unpolish(self)
-            self.style().polish(self)
             print("Windows theme applied successfully")
         else:
             print("Warning: Could not load Windows theme, using default styling")
@@ -1442,6 +1759,9 @@ class SerialRouterMainWindow(QMainWindow):
 
 def main():
     """Main application entry point."""
+    # Pull the registered font files into the page cache while the QApplication spins up
+    resource_manager.prefetch_fonts(("Poppins", "JetBrainsMono"))
+
     app = QApplication(sys.argv)
 
     # CRITICAL FIX: Singleton check - prevent multiple instances
@@ -1470,8 +1790,10 @@ def main():
     app.setApplicationVersion("1.0.2")
     app.setOrganizationName("Serial Router")
 
+    # Read theme and icon sources in the background while fonts load and the window is built
+    resource_manager.preload_async()
+
     # Load custom fonts and set as default
-    from src.gui.resources import resource_manager
     loaded_fonts = resource_manager.load_custom_fonts("Poppins")
     if loaded_fonts:
         # Set Poppins as the default application font
@@ -3,17 +3,128 @@ Resource Management for SerialRouter GUI
 Handles theme loading, icon management, asset paths, and custom font loading.
 """
 
+import logging
+import os
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List
-from PyQt6.QtGui import QIcon, QPixmap, QPalette, QColor, QFont, QFontDatabase
-from PyQt6.QtCore import Qt
+from typing import Callable, Optional, Dict, List, Tuple
+from PyQt6.QtGui import (
+    QIcon, QIconEngine, QPixmap, QPixmapCache, QPalette, QColor, QFont, QFontDatabase, QPainter
+)
+from PyQt6.QtCore import Qt, QByteArray, QRect, QRectF, QSize, QRunnable, QThreadPool
 from PyQt6.QtSvg import QSvgRenderer
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWidgets import QApplication, QStyleOption
+
+
+logger = logging.getLogger(__name__)
+
+
+# QFontDatabase registrations are per process, so this is shared by every ResourceManager
+_registered_font_files: Dict[str, int] = {}  # font file path -> application font id
+
+
+# Stats SVGs are typically under 4 KiB, so 128 entries cap the markup held at ~512 KiB
+@lru_cache(maxsize=128)
+def _read_svg_bytes(path: str) -> bytes:
+    """Read raw SVG markup as bytes - handed straight to QSvgRenderer, no decode/encode."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _warm_page_cache(root: Path):
+    """Read every file under root once, discarding the data, so later opens hit the OS page cache."""
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            try:
+                with open(os.path.join(dirpath, filename), 'rb') as f:
+                    while f.read(65536):
+                        pass
+            except OSError:
+                pass  # Best effort - a failed warm-up only costs the cold read later
+
+
+class ResourcePreloadTask(QRunnable):
+    """QRunnable that warms the file-backed caches off the GUI thread (raw bytes only, no Qt objects)."""
+
+    def __init__(self, manager: "ResourceManager"):
+        super().__init__()
+        self.manager = manager
+
+    def run(self):
+        """Read the theme stylesheet and the recolorable stats SVGs into their caches."""
+        self.manager.load_theme()
+        # Only stats/ icons go through the tinting engine (and so _read_svg_bytes)
+        try:
+            for svg_path in (self.manager._icons_path / "stats").glob("*.svg"):
+                _read_svg_bytes(str(svg_path))
+        except OSError:
+            pass  # Missing folder or unreadable file - the lazy path reports it later
+
+        # Frozen builds run from a fresh PyInstaller extraction (often AV-scanned); one
+        # sequential pass over the remaining icons warms the OS page cache before Qt opens them
+        if getattr(sys, 'frozen', False):
+            _warm_page_cache(self.manager._icons_path)
+
+
+class TintedSvgIconEngine(QIconEngine):
+    """
+    Icon engine for monochrome (currentColor) SVGs.
+
+    The SVG is parsed once; each render is tinted with the current palette text color
+    and kept in QPixmapCache, so palette changes need no re-parse or string rewrite.
+    """
+
+    def __init__(self, renderer: QSvgRenderer, cache_key: str, color_source: Callable[[], str]):
+        super().__init__()
+        self._renderer = renderer
+        self._cache_key = cache_key
+        self._color_source = color_source
+
+    def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
+        """Render (or fetch) the icon at size device pixels in the current text color."""
+        return self._tinted_pixmap(size, 1.0, mode)
+
+    def paint(self, painter: QPainter, rect: QRect, mode: QIcon.Mode, state: QIcon.State):
+        """Draw the tinted icon into rect at the target device's pixel ratio."""
+        dpr = painter.device().devicePixelRatioF()
+        painter.drawPixmap(rect, self._tinted_pixmap(rect.size(), dpr, mode))
+
+    def _tinted_pixmap(self, size: QSize, dpr: float, mode: QIcon.Mode) -> QPixmap:
+        """Render (or fetch) the icon at logical size scaled by dpr, tinted with the text color."""
+        color_hex = self._color_source()
+        key = f"{self._cache_key}:{color_hex}:{size.width()}x{size.height()}@{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(round(size.width() * dpr), round(size.height() * dpr))
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            self._renderer.render(painter, QRectF(pixmap.rect()))
+            # Every shape is currentColor - recolor the rendered coverage with one fill
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+            painter.fillRect(pixmap.rect(), QColor(color_hex))
+            painter.end()
+            # Set after painting so the render above fills the full device-pixel canvas
+            pixmap.setDevicePixelRatio(dpr)
+            QPixmapCache.insert(key, pixmap)
+
+        if mode != QIcon.Mode.Normal:
+            generated = QApplication.style().generatedIconPixmap(mode, pixmap, QStyleOption())
+            if not generated.isNull():
+                return generated
+        return pixmap
+
+    def clone(self) -> "TintedSvgIconEngine":
+        """Copy sharing the parsed renderer."""
+        return TintedSvgIconEngine(self._renderer, self._cache_key, self._color_source)
 
 
 class ResourceManager:
     """Centralized resource management for GUI assets."""
+
+    # Window/taskbar/alt-tab sizes - the app icon is rasterized at just these
+    APP_ICON_SIZES = (16, 32, 48, 256)
     
     def __init__(self):
         self._base_path = self._get_base_path()
@@ -26,10 +137,23 @@ class ResourceManager:
         self._default_font_family = "Poppins"  # Easy to change
         self._default_font_size = 9
         self._loaded_fonts: Dict[str, int] = {}  # font_name -> font_id
-
-        # Ensure directories exist
-        self._themes_path.mkdir(parents=True, exist_ok=True)
+        self._monospace_fonts: Dict[int, QFont] = {}  # point size -> resolved monospace font
+        self._theme_cache: Dict[str, tuple] = {}  # theme path -> (mtime_ns, stylesheet)
+        self._theme_lock = threading.Lock()  # load_theme also runs on the preload worker
+        self._text_color_hex: Optional[str] = None  # Palette WindowText color, reset on palette change
+        self._palette_hooked = False  # paletteChanged connected (needs the QApplication to exist)
+        self._icon_paths: Dict[Tuple[str, str], Optional[Path]] = {}  # (subfolder, name) -> resolved path
+        self._icon_cache: Dict[tuple, QIcon] = {}  # (subfolder, name, sizes) -> loaded icon
+        self._pixmap_cache: Dict[tuple, QPixmap] = {}  # (subfolder, name, size) -> loaded pixmap
+        self._stats_icons: Dict[Tuple[str, str], QIcon] = {}  # (subfolder, name) -> tinted SVG icon
+        self._themes_dir_ready = False  # Themes directory created lazily on first theme access
         
+    def _ensure_themes_dir(self):
+        """Create the themes directory on first use rather than at construction."""
+        if not self._themes_dir_ready:
+            self._themes_path.mkdir(parents=True, exist_ok=True)
+            self._themes_dir_ready = True
+
     def _get_base_path(self) -> Path:
         """Get the base path of the application."""
         if getattr(sys, 'frozen', False):
@@ -46,6 +170,7 @@ class ResourceManager:
     
     def get_theme_path(self, theme_name: str = "theme.qss") -> Optional[Path]:
         """Get path to theme file."""
+        self._ensure_themes_dir()
         theme_path = self._themes_path / theme_name
         if theme_path.exists():
             return theme_path
@@ -53,55 +178,136 @@ class ResourceManager:
     
     def load_theme(self, theme_name: str = "theme.qss") -> str:
         """Load theme stylesheet content."""
-        theme_path = self.get_theme_path(theme_name)
-        if theme_path and theme_path.exists():
-            try:
-                with open(theme_path, 'r', encoding='utf-8') as f:
-                    return f.read()
-            except Exception as e:
-                print(f"Warning: Failed to load theme {theme_name}: {e}")
-                return ""
-        else:
-            print(f"Warning: Theme file not found: {theme_name}")
+        with self._theme_lock:
+            return self._load_theme_locked(theme_name)
+
+    def _load_theme_locked(self, theme_name: str) -> str:
+        """Read the stylesheet through the mtime cache; caller holds _theme_lock."""
+        self._ensure_themes_dir()
+
+        # Stat once and let FileNotFoundError stand in for a separate exists() probe
+        theme_path = self._themes_path / theme_name
+        try:
+            # Reuse the stylesheet until the file changes on disk
+            mtime_ns = theme_path.stat().st_mtime_ns
+            cached = self._theme_cache.get(str(theme_path))
+            if cached and cached[0] == mtime_ns:
+                return cached[1]
+            with open(theme_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            self._theme_cache[str(theme_path)] = (mtime_ns, content)
+            return content
+        except FileNotFoundError:
+            logger.warning("Theme file not found: %s", theme_name)
+            return ""
+        except Exception as e:
+            logger.warning("Failed to load theme %s: %s", theme_name, e)
             return ""
     
     def get_icon_path(self, icon_name: str, subfolder: str = "") -> Optional[Path]:
         """Get path to icon file."""
+        # Bundled assets don't move at runtime - resolve (and stat) each icon once
+        key = (subfolder, icon_name)
+        if key in self._icon_paths:
+            return self._icon_paths[key]
+
         if subfolder:
             icon_path = self._icons_path / subfolder / icon_name
         else:
             icon_path = self._icons_path / icon_name
             
-        if icon_path.exists():
-            return icon_path
-        return None
+        resolved = icon_path if icon_path.exists() else None
+        self._icon_paths[key] = resolved
+        return resolved
     
-    def load_icon(self, icon_name: str, subfolder: str = "") -> QIcon:
-        """Load icon from assets."""
+    def load_icon(self, icon_name: str, subfolder: str = "",
+                  sizes: Optional[Tuple[int, ...]] = None) -> QIcon:
+        """
+        Load icon from assets.
+
+        Pass sizes to rasterize the icon once at just those pixel sizes, so a large
+        multi-layer source (e.g. the .ico) isn't retained at full resolution.
+        """
+        key = (subfolder, icon_name, sizes)
+        cached = self._icon_cache.get(key)
+        if cached is not None:
+            return QIcon(cached)  # Implicitly shared copy - callers can't alter the cached icon
+
         icon_path = self.get_icon_path(icon_name, subfolder)
         if icon_path:
-            return QIcon(str(icon_path))
+            icon = QIcon(str(icon_path))
+            if sizes:
+                sized_icon = QIcon()
+                for size in sizes:
+                    sized_icon.addPixmap(icon.pixmap(size, size))
+                icon = sized_icon
+            self._icon_cache[key] = icon
+            return QIcon(icon)
         else:
-            print(f"Warning: Icon not found: {icon_name}")
+            logger.warning("Icon not found: %s", icon_name)
             return QIcon()  # Return empty icon as fallback
     
-    def load_pixmap(self, icon_name: str, subfolder: str = "") -> QPixmap:
-        """Load pixmap from assets."""
+    def load_pixmap(self, icon_name: str, subfolder: str = "", size: Optional[int] = None) -> QPixmap:
+        """Load pixmap from assets, optionally scaled once to fit a size x size box."""
+        key = (subfolder, icon_name, size)
+        cached = self._pixmap_cache.get(key)
+        if cached is not None:
+            return QPixmap(cached)  # Implicitly shared copy - painting on it detaches
+
         icon_path = self.get_icon_path(icon_name, subfolder)
         if icon_path:
-            return QPixmap(str(icon_path))
+            pixmap = QPixmap(str(icon_path))
+            if size is not None:
+                pixmap = pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                                       Qt.TransformationMode.SmoothTransformation)
+            self._pixmap_cache[key] = pixmap
+            return QPixmap(pixmap)
         else:
-            print(f"Warning: Pixmap not found: {icon_name}")
+            logger.warning("Pixmap not found: %s", icon_name)
             return QPixmap()  # Return empty pixmap as fallback
+
+    def preload_async(self):
+        """
+        Start reading the theme and stats SVGs on the global thread pool.
+
+        Only file contents are cached here; QIcon/QPixmap construction stays on the
+        GUI thread and simply finds its source text already in memory.
+        """
+        QThreadPool.globalInstance().start(ResourcePreloadTask(self))
+
+    def prefetch_fonts(self, font_folders: Tuple[str, ...]) -> threading.Thread:
+        """
+        Start reading the given font folders on a background thread.
+
+        addApplicationFont must run on the GUI thread, but it can parse from the page
+        cache instead of disk. Nothing waits on the thread - a prefetch that finishes
+        late only means those files are read cold, as they would have been anyway.
+        """
+        def prefetch():
+            for folder in font_folders:
+                _warm_page_cache(self._fonts_path / folder)
+
+        thread = threading.Thread(target=prefetch, name="FontPrefetch", daemon=True)
+        thread.start()
+        return thread
+
+    def clear_icon_cache(self):
+        """Drop every cached icon, pixmap and resolved icon path."""
+        self._icon_paths.clear()
+        self._icon_cache.clear()
+        self._pixmap_cache.clear()
+        self._stats_icons.clear()
+        QPixmapCache.clear()  # Tinted stats icon renders
+        _read_svg_bytes.cache_clear()
     
     def get_app_icon(self) -> QIcon:
         """Get the main application icon."""
         # Try ICO first, then SVG as fallback
-        ico_icon = self.load_icon("app_icon.ico")
+        ico_icon = self.load_icon("app_icon.ico", sizes=self.APP_ICON_SIZES)
         if not ico_icon.isNull():
             return ico_icon
 
-        svg_icon = self.load_icon("app_icon.svg")
+        svg_icon = self.load_icon("app_icon.svg", sizes=self.APP_ICON_SIZES)
         if not svg_icon.isNull():
             return svg_icon
 
@@ -119,50 +325,59 @@ class ResourceManager:
         icon_name = f"{action_name}.svg"
         return self.load_icon(icon_name, "toolbar")
 
-    def get_stats_icon(self, icon_name: str, subfolder: str = "stats") -> QIcon:
-        """Get stats monitoring icon by name, recolored to match exact text color."""
-        icon_file = f"{icon_name}.svg"
-        icon_path = self.get_icon_path(icon_file, subfolder)
+    def _current_text_color_hex(self) -> str:
+        """Get the exact palette text color, cached until the application palette changes."""
+        if self._text_color_hex is not None:
+            return self._text_color_hex
 
-        if not icon_path:
-            print(f"Warning: Stats icon not found: {icon_file} in {subfolder}")
-            return QIcon()
+        app = QApplication.instance()
+        if not app:
+            # Fallback to white for dark themes (not cached - no app to watch yet)
+            return "#FFFFFF"
 
-        # Read SVG content
-        try:
-            with open(icon_path, 'r', encoding='utf-8') as f:
-                svg_content = f.read()
-
-            # Get exact palette text color (no modification)
-            app = QApplication.instance()
-            if app:
-                palette = app.palette()
-                text_color = palette.color(QPalette.ColorRole.WindowText)
-                color_hex = text_color.name()
-            else:
-                # Fallback to white for dark themes
-                color_hex = "#FFFFFF"
+        if not self._palette_hooked:
+            app.paletteChanged.connect(self._on_palette_changed)
+            self._palette_hooked = True
+        self._text_color_hex = app.palette().color(QPalette.ColorRole.WindowText).name()
+        return self._text_color_hex
 
-            # Replace currentColor with exact text color
-            svg_content = svg_content.replace('currentColor', color_hex)
+    def _on_palette_changed(self, palette):
+        """Drop the cached text color; old-color icons age out of QPixmapCache on their own."""
+        self._text_color_hex = None
 
-            # Create QIcon from modified SVG
-            from PyQt6.QtCore import QByteArray
-            svg_bytes = QByteArray(svg_content.encode('utf-8'))
-            renderer = QSvgRenderer(svg_bytes)
+    def get_stats_icon(self, icon_name: str, subfolder: str = "stats") -> QIcon:
+        """Get stats monitoring icon by name, drawn in the exact palette text color."""
+        # One engine per icon - it tints on render, so the palette color isn't part of the key
+        key = (subfolder, icon_name)
+        cached = self._stats_icons.get(key)
+        if cached is not None:
+            return QIcon(cached)
 
-            pixmap = QPixmap(16, 16)
-            pixmap.fill(Qt.GlobalColor.transparent)
+        icon_file = f"{icon_name}.svg"
+        if subfolder:
+            icon_path = self._icons_path / subfolder / icon_file
+        else:
+            icon_path = self._icons_path / icon_file
 
-            from PyQt6.QtGui import QPainter
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
+        # A missing file surfaces as FileNotFoundError, no exists() probe
+        try:
+            svg_bytes = _read_svg_bytes(str(icon_path))
+
+            # Parse the SVG once; the engine recolors each render it produces
+            renderer = QSvgRenderer(QByteArray(svg_bytes))
+            if not renderer.isValid():
+                raise ValueError("invalid SVG")
 
-            return QIcon(pixmap)
+            icon = QIcon(TintedSvgIconEngine(renderer, f"stats:{subfolder}/{icon_name}",
+                                             self._current_text_color_hex))
+            self._stats_icons[key] = icon
+            return QIcon(icon)
 
+        except FileNotFoundError:
+            logger.warning("Stats icon not found: %s in %s", icon_file, subfolder)
+            return QIcon()
         except Exception as e:
-            print(f"Warning: Failed to recolor stats icon {icon_file}: {e}")
+            logger.warning("Failed to recolor stats icon %s: %s", icon_file, e)
             return self.load_icon(icon_file, "stats")
 
     @property
@@ -178,6 +393,7 @@ class ResourceManager:
     @property
     def themes_path(self) -> Path:
         """Get themes directory path."""
+        self._ensure_themes_dir()
         return self._themes_path
 
     @property
@@ -201,20 +417,28 @@ class ResourceManager:
 
         font_dir = self._fonts_path / font_folder
 
-        if not font_dir.exists():
-            print(f"Warning: Font directory not found: {font_dir}")
+        # Find all .ttf and .otf files in a single directory pass (hidden files skipped)
+        try:
+            with os.scandir(font_dir) as entries:
+                font_files = [entry.path for entry in entries
+                              if not entry.name.startswith('.')
+                              and entry.name.lower().endswith(('.ttf', '.otf'))
+                              and entry.is_file()]
+        except FileNotFoundError:
+            logger.warning("Font directory not found: %s", font_dir)
             return loaded_families
 
-        # Find all .ttf and .otf files
-        font_files = list(font_dir.glob("*.ttf")) + list(font_dir.glob("*.otf"))
-
         if not font_files:
-            print(f"Warning: No font files found in {font_dir}")
+            logger.warning("No font files found in %s", font_dir)
             return loaded_families
 
-        # Load each font file
+        # Load each font file - files already registered in this process are reused
         for font_file in font_files:
-            font_id = QFontDatabase.addApplicationFont(str(font_file))
+            font_id = _registered_font_files.get(font_file)
+            if font_id is None:
+                font_id = QFontDatabase.addApplicationFont(font_file)
+                if font_id != -1:
+                    _registered_font_files[font_file] = font_id
 
             if font_id != -1:
                 # Get font families from this file
@@ -225,7 +449,7 @@ class ResourceManager:
                     if family_name not in loaded_families:
                         loaded_families.append(family_name)
             else:
-                print(f"Warning: Failed to load font: {font_file.name}")
+                logger.warning("Failed to load font: %s", os.path.basename(font_file))
 
         if loaded_families:
             print(f"Loaded {len(font_files)} font files ({', '.join(loaded_families)})")
@@ -262,10 +486,16 @@ class ResourceManager:
             QFont configured with JetBrains Mono and fallback chain
         """
         font_size = size if size is not None else self._default_font_size
-        font = QFont("JetBrains Mono", font_size)
-        font.setStyleHint(QFont.StyleHint.TypeWriter)
-        font.setFamilies(["JetBrains Mono", "Cascadia Code", "Cascadia Mono", "Consolas", "Courier New", "monospace"])
-        return font
+        font = self._monospace_fonts.get(font_size)
+        if font is None:
+            font = QFont()
+            font.setPointSize(font_size)
+            # Real family names only - the TypeWriter style hint covers the generic monospace fallback
+            font.setFamilies(["JetBrains Mono", "Cascadia Code", "Cascadia Mono", "Consolas", "Courier New"])
+            font.setStyleHint(QFont.StyleHint.TypeWriter)
+            self._monospace_fonts[font_size] = font
+        # Implicitly shared copy - callers may adjust it without touching the cached font
+        return QFont(font)
 
     def set_default_font_family(self, family: str):
         """Change the default font family. Call before loading fonts."""
@@ -284,5 +514,14 @@ class ResourceManager:
         return list(self._loaded_fonts.keys())
 
 
-# Global resource manager instance
-resource_manager = ResourceManager()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_resource_manager() -> ResourceManager:
+    """Get the global resource manager, created on first use."""
+    return ResourceManager()
+
+
+def __getattr__(name: str):
+    """Resolve the module-level resource_manager lazily (PEP 562) for existing imports."""
+    if name == "resource_manager":
+        return get_resource_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")